@@ -1,8 +1,8 @@
-from .models import AccountState, TokenState, Order, Trade, PositionSnapshot, FundingPayment, BotRun, Base
+from .models import AccountState, TokenState, Order, Trade, PositionSnapshot, FundingPayment, BotRun, Base, upsert
 from .connection import AsyncDatabaseManager
 from .repositories import AccountRepository, BotRunRepository
 from .repositories.order_repository import OrderRepository
 from .repositories.trade_repository import TradeRepository
 from .repositories.funding_repository import FundingRepository
 
-__all__ = ["AccountState", "TokenState", "Order", "Trade", "PositionSnapshot", "FundingPayment", "BotRun", "Base", "AsyncDatabaseManager", "AccountRepository", "BotRunRepository", "OrderRepository", "TradeRepository", "FundingRepository"]
\ No newline at end of file
+__all__ = ["AccountState", "TokenState", "Order", "Trade", "PositionSnapshot", "FundingPayment", "BotRun", "Base", "upsert", "AsyncDatabaseManager", "AccountRepository", "BotRunRepository", "OrderRepository", "TradeRepository", "FundingRepository"]
\ No newline at end of file
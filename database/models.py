@@ -1,36 +1,134 @@
+import sys
+from datetime import datetime, timezone
+
 from sqlalchemy import (
     TIMESTAMP,
     Column,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
+    SmallInteger,
     String,
     Text,
-    func,
+    text,
 )
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy.types import TypeDecorator
+
+
+class Base(DeclarativeBase):
+    """SQLAlchemy 2.x declarative base; mapper setup resolves at class-body evaluation."""
+    pass
+
+
+def _utcnow() -> datetime:
+    """Client-side UTC default so batched inserts avoid a server-side round-trip."""
+    return datetime.now(timezone.utc)
+
+
+# Read-heavy price/PnL columns are only ever consumed as floats, so skip the
+# costly Decimal construction when decoding result sets.
+MoneyNumeric = Numeric(precision=30, scale=18, asdecimal=False)
+
+
+class Vocabulary(TypeDecorator):
+    """Stores a small fixed string vocabulary as SMALLINT.
+
+    Application code keeps reading/writing the string values; only the on-disk
+    representation shrinks (~10 bytes of varlena per value down to 2), which
+    also makes index entries and equality checks cheap.
+
+    Out-of-vocabulary bind values map to a sentinel code that no stored row
+    uses, so a filter like ``status == "filled"`` returns an empty page (as a
+    plain string column would) instead of raising mid-execution.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    # Real codes start at 1, so 0 never matches a stored value
+    _UNKNOWN_CODE = 0
+
+    def __init__(self, *values: str):
+        super().__init__()
+        self.values = values
+        self._to_int = {value: code for code, value in enumerate(values, start=1)}
+        self._to_str = {code: value for value, code in self._to_int.items()}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._to_int.get(value, self._UNKNOWN_CODE)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # Unknown codes (the sentinel, if one was ever persisted) decode to None
+        return self._to_str.get(value)
+
 
-Base = declarative_base()
+class InternedString(TypeDecorator):
+    """String column whose values come from a small repeated set (account,
+    connector and pair names). Interning on decode makes every row share one
+    Python string object instead of allocating a fresh copy per row.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return sys.intern(value)
+
+
+OrderStatus = Vocabulary("SUBMITTED", "OPEN", "PARTIALLY_FILLED", "FILLED", "CANCELLED", "FAILED", "PENDING_CREATE", "PENDING")
+TradeTypeVocab = Vocabulary("BUY", "SELL")
+OrderTypeVocab = Vocabulary("LIMIT", "MARKET", "LIMIT_MAKER")
+PositionSide = Vocabulary("LONG", "SHORT", "BOTH", "UNKNOWN")
+ReconciliationStatus = Vocabulary("PENDING", "RECONCILED", "MISMATCH")
+DeploymentStatus = Vocabulary("DEPLOYED", "FAILED", "ARCHIVED")
+RunStatus = Vocabulary("CREATED", "RUNNING", "STOPPED", "ERROR")
+
+
+async def upsert(session, model, rows, conflict_cols):
+    """Batched insert-if-new keyed on an existing unique index.
+
+    Collapses the SELECT-then-INSERT ingestion pattern into a single
+    ``INSERT ... ON CONFLICT DO NOTHING`` round-trip, e.g.::
+
+        await upsert(session, Trade, rows, ["trade_id"])
+    """
+    if not rows:
+        return
+    stmt = pg_insert(model).on_conflict_do_nothing(index_elements=conflict_cols)
+    await session.execute(stmt, rows)
 
 
 class AccountState(Base):
     __tablename__ = "account_states"
 
     id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False, index=True)
-    account_name = Column(String, nullable=False, index=True)
-    connector_name = Column(String, nullable=False, index=True)
+    timestamp = Column(TIMESTAMP(timezone=True), default=_utcnow, nullable=False, index=True)
+    account_name = Column(InternedString, nullable=False, index=True)
+    connector_name = Column(InternedString, nullable=False, index=True)
     
-    token_states = relationship("TokenState", back_populates="account_state", cascade="all, delete-orphan")
+    token_states = relationship(
+        "TokenState", back_populates="account_state", cascade="save-update, merge", passive_deletes=True, lazy="selectin"
+    )
 
 
 class TokenState(Base):
     __tablename__ = "token_states"
 
     id = Column(Integer, primary_key=True, index=True)
-    account_state_id = Column(Integer, ForeignKey("account_states.id"), nullable=False)
-    token = Column(String, nullable=False, index=True)
+    account_state_id = Column(Integer, ForeignKey("account_states.id", ondelete="CASCADE"), nullable=False)
+    token = Column(InternedString, nullable=False, index=True)
     units = Column(Numeric(precision=30, scale=18), nullable=False)
     price = Column(Numeric(precision=30, scale=18), nullable=False)
     value = Column(Numeric(precision=30, scale=18), nullable=False)
@@ -41,31 +139,41 @@ class TokenState(Base):
 
 class Order(Base):
     __tablename__ = "orders"
-    
+    __table_args__ = (
+        # Composite indexes matching the filter/order-by shapes used in OrderRepository,
+        # so filtered listings resolve to a single index range scan instead of
+        # bitmap-merging several single-column indexes.
+        Index("ix_orders_acct_conn_pair_created", "account_name", "connector_name", "trading_pair", "created_at"),
+        Index("ix_orders_status_created", "status", "created_at"),
+        # Partial index over the active working set only (SUBMITTED=1, OPEN=2 in
+        # the OrderStatus vocabulary); stays tiny as terminal rows accumulate.
+        Index("ix_orders_open", "account_name", "trading_pair", postgresql_where=text("status IN (1, 2)")),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     # Order identification
     client_order_id = Column(String, nullable=False, unique=True, index=True)
     exchange_order_id = Column(String, nullable=True, index=True)
     
     # Timestamps
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False, index=True)
-    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    
-    # Account and connector info
-    account_name = Column(String, nullable=False, index=True)
-    connector_name = Column(String, nullable=False, index=True)
+    created_at = Column(TIMESTAMP(timezone=True), default=_utcnow, nullable=False, index=True)
+    updated_at = Column(TIMESTAMP(timezone=True), default=_utcnow, onupdate=_utcnow, nullable=False)
     
+    # Account and connector info (covered by ix_orders_acct_conn_pair_created)
+    account_name = Column(InternedString, nullable=False)
+    connector_name = Column(InternedString, nullable=False, index=True)
+
     # Order details
-    trading_pair = Column(String, nullable=False, index=True)
-    trade_type = Column(String, nullable=False)  # BUY, SELL
-    order_type = Column(String, nullable=False)  # LIMIT, MARKET, LIMIT_MAKER
-    amount = Column(Numeric(precision=30, scale=18), nullable=False)
-    price = Column(Numeric(precision=30, scale=18), nullable=True)  # Null for market orders
+    trading_pair = Column(InternedString, nullable=False, index=True)
+    trade_type = Column(TradeTypeVocab, nullable=False)  # BUY, SELL
+    order_type = Column(OrderTypeVocab, nullable=False)  # LIMIT, MARKET, LIMIT_MAKER
+    amount = Column(Numeric(precision=20, scale=8), nullable=False)
+    price = Column(Numeric(precision=20, scale=8), nullable=True)  # Null for market orders
     
-    # Order status and execution
-    status = Column(String, nullable=False, default="SUBMITTED", index=True)  # SUBMITTED, OPEN, FILLED, CANCELLED, FAILED
-    filled_amount = Column(Numeric(precision=30, scale=18), nullable=False, default=0)
-    average_fill_price = Column(Numeric(precision=30, scale=18), nullable=True)
+    # Order status and execution (status covered by ix_orders_status_created)
+    status = Column(OrderStatus, nullable=False, default="SUBMITTED")  # SUBMITTED, OPEN, FILLED, CANCELLED, FAILED
+    filled_amount = Column(Numeric(precision=20, scale=8), nullable=False, default=0)
+    average_fill_price = Column(Numeric(precision=20, scale=8), nullable=True)
     
     # Fee information
     fee_paid = Column(Numeric(precision=30, scale=18), default=0, nullable=True)
@@ -75,27 +183,36 @@ class Order(Base):
     error_message = Column(Text, nullable=True)
     
     # Relationships for future enhancements
-    trades = relationship("Trade", back_populates="order", cascade="all, delete-orphan")
+    # selectin keeps listing endpoints at two queries (parents + one IN(...)) instead of N+1 lazy loads;
+    # deletes cascade in the database (ondelete="CASCADE") so the ORM never loads children to delete them
+    trades = relationship("Trade", back_populates="order", cascade="save-update, merge", passive_deletes=True, lazy="selectin")
 
 
 class Trade(Base):
     __tablename__ = "trades"
-    
+    __table_args__ = (
+        Index("ix_trades_order_id_timestamp", "order_id", "timestamp"),
+        Index("ix_trades_pair_timestamp", "trading_pair", "timestamp"),
+        # BRIN suits the monotonically-increasing timestamp on this append-only table:
+        # a few KB of index gives the same range pruning a multi-GB B-tree would
+        Index("ix_trades_ts_brin", "timestamp", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    order_id = Column(Integer, ForeignKey("orders.id"), nullable=False)
-    
+    order_id = Column(Integer, ForeignKey("orders.id", ondelete="CASCADE"), nullable=False)
+
     # Trade identification
     trade_id = Column(String, nullable=False, unique=True, index=True)
-    
-    # Timestamps
-    timestamp = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
-    
-    # Trade details
-    trading_pair = Column(String, nullable=False, index=True)
-    trade_type = Column(String, nullable=False)  # BUY, SELL
-    amount = Column(Numeric(precision=30, scale=18), nullable=False)
-    price = Column(Numeric(precision=30, scale=18), nullable=False)
-    
+
+    # Timestamps (range scans served by ix_trades_ts_brin)
+    timestamp = Column(TIMESTAMP(timezone=True), nullable=False)
+
+    # Trade details (covered by ix_trades_pair_timestamp)
+    trading_pair = Column(InternedString, nullable=False)
+    trade_type = Column(TradeTypeVocab, nullable=False)  # BUY, SELL
+    amount = Column(MoneyNumeric, nullable=False)
+    price = Column(MoneyNumeric, nullable=False)
+
     # Fee information
     fee_paid = Column(Numeric(precision=30, scale=18), nullable=False, default=0)
     fee_currency = Column(String, nullable=True)
@@ -106,25 +223,40 @@ class Trade(Base):
 
 class PositionSnapshot(Base):
     __tablename__ = "position_snapshots"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    
-    # Position identification
-    account_name = Column(String, nullable=False, index=True)
-    connector_name = Column(String, nullable=False, index=True)
-    trading_pair = Column(String, nullable=False, index=True)
-    
-    # Timestamps
-    timestamp = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False, index=True)
-    
+    __table_args__ = (
+        # DESC on timestamp so "latest snapshot per pair" queries become a backward index scan
+        Index(
+            "ix_position_snapshots_acct_conn_pair_ts",
+            "account_name",
+            "connector_name",
+            "trading_pair",
+            text("timestamp DESC"),
+        ),
+        # PENDING=1 in the ReconciliationStatus vocabulary; keeps the un-reconciled hot set cached
+        Index("ix_positions_pending_reco", "account_name", "trading_pair", postgresql_where=text("is_reconciled = 1")),
+        Index("ix_position_snapshots_ts_brin", "timestamp", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
+
+    # Composite PK includes the partition column so TimescaleDB can convert
+    # this table to a hypertable (every unique constraint must cover it)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+
+    # Position identification (covered by ix_position_snapshots_acct_conn_pair_ts)
+    account_name = Column(InternedString, nullable=False)
+    connector_name = Column(InternedString, nullable=False, index=True)
+    trading_pair = Column(InternedString, nullable=False, index=True)
+
+    # Timestamps (range scans served by ix_position_snapshots_ts_brin)
+    timestamp = Column(TIMESTAMP(timezone=True), primary_key=True, default=_utcnow, nullable=False)
+
     # Real-time exchange data (from connector.account_positions)
-    side = Column(String, nullable=False)  # LONG, SHORT
+    side = Column(PositionSide, nullable=False)  # LONG, SHORT
     exchange_size = Column(Numeric(precision=30, scale=18), nullable=False)  # Size from exchange
-    entry_price = Column(Numeric(precision=30, scale=18), nullable=True)  # Average entry price
-    mark_price = Column(Numeric(precision=30, scale=18), nullable=True)  # Current mark price
-    
+    entry_price = Column(MoneyNumeric, nullable=True)  # Average entry price
+    mark_price = Column(MoneyNumeric, nullable=True)  # Current mark price
+
     # Real-time PnL data (can't be derived from trades alone)
-    unrealized_pnl = Column(Numeric(precision=30, scale=18), nullable=True)  # From exchange
+    unrealized_pnl = Column(MoneyNumeric, nullable=True)  # From exchange
     percentage_pnl = Column(Numeric(precision=10, scale=6), nullable=True)  # PnL percentage
     
     # Leverage and margin info
@@ -143,33 +275,44 @@ class PositionSnapshot(Base):
     
     # Additional metadata
     exchange_position_id = Column(String, nullable=True, index=True)  # Exchange position ID
-    is_reconciled = Column(String, nullable=False, default="PENDING")  # RECONCILED, MISMATCH, PENDING
+    is_reconciled = Column(ReconciliationStatus, nullable=False, default="PENDING")  # RECONCILED, MISMATCH, PENDING
 
 
 class FundingPayment(Base):
     __tablename__ = "funding_payments"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    
-    # Payment identification
-    funding_payment_id = Column(String, nullable=False, unique=True, index=True)
-    
-    # Timestamps
-    timestamp = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
-    
-    # Account and connector info
-    account_name = Column(String, nullable=False, index=True)
-    connector_name = Column(String, nullable=False, index=True)
+    __table_args__ = (
+        Index("ix_funding_payments_acct_conn_pair_ts", "account_name", "connector_name", "trading_pair", "timestamp"),
+        Index("ix_funding_payments_ts_brin", "timestamp", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        # Dedup index scoped per chunk (includes the partition column) so the
+        # table remains hypertable-convertible; an exchange funding id always
+        # carries one timestamp, so uniqueness semantics are unchanged
+        Index("uq_funding_payments_payment_id_ts", "funding_payment_id", "timestamp", unique=True),
+    )
+
+    # Composite PK includes the partition column so TimescaleDB can convert
+    # this table to a hypertable (every unique constraint must cover it)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+
+    # Payment identification (lookups served by the leftmost prefix of
+    # uq_funding_payments_payment_id_ts)
+    funding_payment_id = Column(String, nullable=False)
+
+    # Timestamps (range scans served by ix_funding_payments_ts_brin)
+    timestamp = Column(TIMESTAMP(timezone=True), primary_key=True, nullable=False)
+
+    # Account and connector info (covered by ix_funding_payments_acct_conn_pair_ts)
+    account_name = Column(InternedString, nullable=False)
+    connector_name = Column(InternedString, nullable=False, index=True)
     
     # Funding details
-    trading_pair = Column(String, nullable=False, index=True)
+    trading_pair = Column(InternedString, nullable=False, index=True)
     funding_rate = Column(Numeric(precision=20, scale=18), nullable=False)  # Funding rate
     funding_payment = Column(Numeric(precision=30, scale=18), nullable=False)  # Payment amount
     fee_currency = Column(String, nullable=False)  # Payment currency (usually USDT)
     
     # Position association
     position_size = Column(Numeric(precision=30, scale=18), nullable=True)  # Position size at time of payment
-    position_side = Column(String, nullable=True)  # LONG, SHORT
+    position_side = Column(PositionSide, nullable=True)  # LONG, SHORT
     
     # Additional metadata
     exchange_funding_id = Column(String, nullable=True, index=True)  # Exchange funding ID
@@ -177,7 +320,11 @@ class FundingPayment(Base):
 
 class BotRun(Base):
     __tablename__ = "bot_runs"
-    
+    __table_args__ = (
+        # GIN index enables containment predicates (deployment_config @> {...}) for dashboard filters
+        Index("ix_bot_runs_config_gin", "deployment_config", postgresql_using="gin"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     
     # Bot identification
@@ -185,7 +332,7 @@ class BotRun(Base):
     instance_name = Column(String, nullable=False, index=True)
     
     # Deployment info
-    deployed_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False, index=True)
+    deployed_at = Column(TIMESTAMP(timezone=True), default=_utcnow, nullable=False, index=True)
     strategy_type = Column(String, nullable=False, index=True)  # 'script' or 'controller'
     strategy_name = Column(String, nullable=False, index=True)
     config_name = Column(String, nullable=True, index=True)
@@ -194,15 +341,15 @@ class BotRun(Base):
     stopped_at = Column(TIMESTAMP(timezone=True), nullable=True, index=True)
     
     # Status tracking
-    deployment_status = Column(String, nullable=False, default="DEPLOYED", index=True)  # DEPLOYED, FAILED, ARCHIVED
-    run_status = Column(String, nullable=False, default="CREATED", index=True)  # CREATED, RUNNING, STOPPED, ERROR
+    deployment_status = Column(DeploymentStatus, nullable=False, default="DEPLOYED", index=True)  # DEPLOYED, FAILED, ARCHIVED
+    run_status = Column(RunStatus, nullable=False, default="CREATED", index=True)  # CREATED, RUNNING, STOPPED, ERROR
     
-    # Configuration and final state
-    deployment_config = Column(Text, nullable=True)  # JSON of full deployment config
-    final_status = Column(Text, nullable=True)  # JSON of final bot state, performance, etc.
+    # Configuration and final state (JSONB: asyncpg decodes these in C, no Python json.loads)
+    deployment_config = Column(JSONB, nullable=True)  # Full deployment config
+    final_status = Column(JSONB, nullable=True)  # Final bot state, performance, etc.
     
     # Account info
-    account_name = Column(String, nullable=False, index=True)
+    account_name = Column(InternedString, nullable=False, index=True)
     
     # Metadata
     image_version = Column(String, nullable=True, index=True)
@@ -1,5 +1,4 @@
 from datetime import datetime
-from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 import base64
 import json
@@ -9,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from database import AccountState, TokenState
+from utils.decimals import to_decimal
 
 
 class AccountRepository:
@@ -39,16 +39,56 @@ class AccountRepository:
             token_state = TokenState(
                 account_state_id=account_state.id,
                 token=token_info["token"],
-                units=Decimal(str(token_info["units"])),
-                price=Decimal(str(token_info["price"])),
-                value=Decimal(str(token_info["value"])),
-                available_units=Decimal(str(token_info["available_units"]))
+                units=to_decimal(token_info["units"]),
+                price=to_decimal(token_info["price"]),
+                value=to_decimal(token_info["value"]),
+                available_units=to_decimal(token_info["available_units"])
             )
             self.session.add(token_state)
         
         await self.session.commit()
         return account_state
 
+    async def save_account_states_batch(self, snapshot: Dict[str, Dict[str, List[Dict]]],
+                                        snapshot_timestamp: datetime) -> None:
+        """
+        Persist a whole account-state snapshot in one transaction.
+
+        All AccountState rows are flushed together (one batched INSERT via
+        insertmanyvalues) before their TokenState rows, instead of paying a
+        flush + commit round-trip per account/connector pair.
+        """
+        pending = []
+        for account_name, connectors in snapshot.items():
+            for connector_name, tokens_info in connectors.items():
+                if not tokens_info:
+                    continue
+                account_state = AccountState(
+                    account_name=account_name,
+                    connector_name=connector_name,
+                    timestamp=snapshot_timestamp
+                )
+                pending.append((account_state, tokens_info))
+
+        if not pending:
+            return
+
+        self.session.add_all(state for state, _ in pending)
+        await self.session.flush()  # Assign all the IDs in one batch
+
+        for account_state, tokens_info in pending:
+            for token_info in tokens_info:
+                self.session.add(TokenState(
+                    account_state_id=account_state.id,
+                    token=token_info["token"],
+                    units=to_decimal(token_info["units"]),
+                    price=to_decimal(token_info["price"]),
+                    value=to_decimal(token_info["value"]),
+                    available_units=to_decimal(token_info["available_units"])
+                ))
+
+        await self.session.commit()
+
     async def get_latest_account_states(self) -> Dict[str, Dict[str, List[Dict]]]:
         """
         Get the latest account states for all accounts and connectors.
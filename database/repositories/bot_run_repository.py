@@ -1,4 +1,3 @@
-import json
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 
@@ -32,7 +31,7 @@ class BotRunRepository:
             config_name=config_name,
             account_name=account_name,
             image_version=image_version,
-            deployment_config=json.dumps(deployment_config) if deployment_config else None,
+            deployment_config=deployment_config if deployment_config else None,
             deployment_status="DEPLOYED",
             run_status="CREATED"
         )
@@ -63,7 +62,7 @@ class BotRunRepository:
         if bot_run:
             bot_run.run_status = "STOPPED" if not error_message else "ERROR"
             bot_run.stopped_at = datetime.utcnow()
-            bot_run.final_status = json.dumps(final_status) if final_status else None
+            bot_run.final_status = final_status if final_status else None
             bot_run.error_message = error_message
             await self.session.flush()
             await self.session.refresh(bot_run)
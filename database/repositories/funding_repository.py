@@ -1,11 +1,11 @@
 from datetime import datetime
 from typing import Dict, List, Optional
-from decimal import Decimal
 
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.models import FundingPayment
+from database.models import FundingPayment, upsert
+from utils.decimals import DECIMAL_ZERO, to_decimal
 
 
 class FundingRepository:
@@ -19,6 +19,10 @@ class FundingRepository:
         await self.session.flush()  # Get the ID
         return funding
 
+    async def bulk_insert_funding_payments(self, rows: List[Dict]) -> None:
+        """Insert many funding payments in one batch; duplicates are skipped so retries stay idempotent."""
+        await upsert(self.session, FundingPayment, rows, ["funding_payment_id", "timestamp"])
+
     async def get_funding_payments(self, account_name: str, connector_name: str = None, 
                                  trading_pair: str = None, limit: int = 100) -> List[FundingPayment]:
         """Get funding payments with optional filters."""
@@ -46,11 +50,11 @@ class FundingRepository:
         result = await self.session.execute(query)
         payments = result.scalars().all()
         
-        total_funding = Decimal('0')
+        total_funding = DECIMAL_ZERO
         payment_count = 0
         
         for payment in payments:
-            total_funding += Decimal(str(payment.funding_payment))
+            total_funding += to_decimal(payment.funding_payment)
             payment_count += 1
             
         return {
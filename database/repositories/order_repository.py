@@ -6,6 +6,7 @@ from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models import Order
+from utils.decimals import to_decimal
 
 
 class OrderRepository:
@@ -50,7 +51,7 @@ class OrderRepository:
         order = result.scalar_one_or_none()
         if order:
             # Add to existing filled amount instead of replacing
-            previous_filled = Decimal(str(order.filled_amount or 0))
+            previous_filled = to_decimal(order.filled_amount)
             order.filled_amount = float(previous_filled + filled_amount)
             
             # Update average price (simplified - use latest fill price)
@@ -58,7 +59,7 @@ class OrderRepository:
             
             # Add to existing fees
             if fee_paid is not None:
-                previous_fee = Decimal(str(order.fee_paid or 0))
+                previous_fee = to_decimal(order.fee_paid)
                 order.fee_paid = float(previous_fee + fee_paid)
             if fee_currency:
                 order.fee_currency = fee_currency
@@ -66,8 +67,8 @@ class OrderRepository:
                 order.exchange_order_id = exchange_order_id
             
             # Update status based on total filled amount
-            total_filled = Decimal(str(order.filled_amount))
-            if total_filled >= Decimal(str(order.amount)):
+            total_filled = to_decimal(order.filled_amount)
+            if total_filled >= to_decimal(order.amount):
                 order.status = "FILLED"
             elif total_filled > 0:
                 order.status = "PARTIALLY_FILLED"
@@ -4,7 +4,7 @@ from typing import Dict, List, Optional
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.models import Trade, Order
+from database.models import Trade, Order, upsert
 
 
 class TradeRepository:
@@ -18,6 +18,13 @@ class TradeRepository:
         await self.session.flush()  # Get the ID
         return trade
 
+    async def bulk_insert_trades(self, rows: List[Dict]) -> None:
+        """Insert many trades in one executemany batch, bypassing the unit-of-work.
+
+        Duplicate trade_ids are skipped so event replays stay idempotent.
+        """
+        await upsert(self.session, Trade, rows, ["trade_id"])
+
     async def get_trades(self, account_name: Optional[str] = None,
                         connector_name: Optional[str] = None,
                         trading_pair: Optional[str] = None,
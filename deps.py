@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from fastapi import Request
 from services.bots_orchestrator import BotsOrchestrator
 from services.accounts_service import AccountsService
@@ -7,31 +9,46 @@ from utils.bot_archiver import BotArchiver
 from database import AsyncDatabaseManager
 
 
-def get_bots_orchestrator(request: Request) -> BotsOrchestrator:
+@dataclass(frozen=True, slots=True)
+class ServiceBundle:
+    """Immutable bundle of app-level services, resolved once at startup.
+
+    Dependencies read one attribute off this bundle instead of walking
+    ``request.app.state.<service>`` chains on every request.
+    """
+
+    bots_orchestrator: BotsOrchestrator
+    accounts_service: AccountsService
+    docker_service: DockerService
+    market_data_feed_manager: MarketDataFeedManager
+    bot_archiver: BotArchiver
+
+
+async def get_bots_orchestrator(request: Request) -> BotsOrchestrator:
     """Get BotsOrchestrator service from app state."""
-    return request.app.state.bots_orchestrator
+    return request.app.state.services.bots_orchestrator
 
 
-def get_accounts_service(request: Request) -> AccountsService:
+async def get_accounts_service(request: Request) -> AccountsService:
     """Get AccountsService from app state."""
-    return request.app.state.accounts_service
+    return request.app.state.services.accounts_service
 
 
-def get_docker_service(request: Request) -> DockerService:
+async def get_docker_service(request: Request) -> DockerService:
     """Get DockerService from app state."""
-    return request.app.state.docker_service
+    return request.app.state.services.docker_service
 
 
-def get_market_data_feed_manager(request: Request) -> MarketDataFeedManager:
+async def get_market_data_feed_manager(request: Request) -> MarketDataFeedManager:
     """Get MarketDataFeedManager from app state."""
-    return request.app.state.market_data_feed_manager
+    return request.app.state.services.market_data_feed_manager
 
 
-def get_bot_archiver(request: Request) -> BotArchiver:
+async def get_bot_archiver(request: Request) -> BotArchiver:
     """Get BotArchiver from app state."""
-    return request.app.state.bot_archiver
+    return request.app.state.services.bot_archiver
 
 
-def get_database_manager(request: Request) -> AsyncDatabaseManager:
+async def get_database_manager(request: Request) -> AsyncDatabaseManager:
     """Get AsyncDatabaseManager from app state."""
-    return request.app.state.accounts_service.db_manager
\ No newline at end of file
+    return request.app.state.services.accounts_service.db_manager
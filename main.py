@@ -53,12 +53,15 @@ from fastapi.middleware.cors import CORSMiddleware
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger
 
+from utils.docker_client import close_shared_docker_client
+from utils.responses import ORJSONResponse
 from utils.security import BackendAPISecurity
 from services.bots_orchestrator import BotsOrchestrator
 from services.accounts_service import AccountsService
 from services.docker_service import DockerService
 from services.market_data_feed_manager import MarketDataFeedManager
 from utils.bot_archiver import BotArchiver
+from deps import ServiceBundle
 from routers import (
     accounts,
     archived_bots,
@@ -141,7 +144,15 @@ async def lifespan(app: FastAPI):
     # Initialize database
     await accounts_service.ensure_db_initialized()
 
-    # Store services in app state
+    # Store services in app state (single bundle resolved once; keep the flat
+    # attributes for handlers that still read request.app.state directly)
+    app.state.services = ServiceBundle(
+        bots_orchestrator=bots_orchestrator,
+        accounts_service=accounts_service,
+        docker_service=docker_service,
+        market_data_feed_manager=market_data_feed_manager,
+        bot_archiver=bot_archiver,
+    )
     app.state.bots_orchestrator = bots_orchestrator
     app.state.accounts_service = accounts_service
     app.state.docker_service = docker_service
@@ -153,6 +164,11 @@ async def lifespan(app: FastAPI):
     accounts_service.start()
     market_data_feed_manager.start()
 
+    # Warm the OpenAPI schema cache: generation walks model_json_schema() for
+    # every request/response model, so pay that cost at startup instead of on
+    # the first /docs or /openapi.json hit.
+    app.openapi()
+
     yield
 
     # Shutdown services
@@ -162,8 +178,9 @@ async def lifespan(app: FastAPI):
     # Stop market data feed manager (which will stop all feeds)
     market_data_feed_manager.stop()
 
-    # Clean up docker service
+    # Clean up docker service and release the shared client's connections
     docker_service.cleanup()
+    close_shared_docker_client()
 
     # Close database connections
     await accounts_service.db_manager.close()
@@ -175,6 +192,7 @@ app = FastAPI(
     description="API for managing Hummingbot trading instances",
     version=VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
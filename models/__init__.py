@@ -3,261 +3,138 @@ Model definitions for the Backend API.
 
 Each model file corresponds to a router file with the same name.
 Models are organized by functional domain to match the API structure.
-"""
-
-# Bot orchestration models (bot lifecycle management)
-from .bot_orchestration import (
-    BotAction,
-    StartBotAction,
-    StopBotAction,
-    ImportStrategyAction,
-    ConfigureBotAction,
-    ShortcutAction,
-    BotStatus,
-    BotHistoryRequest,
-    BotHistoryResponse,
-    MQTTStatus,
-    AllBotsStatusResponse,
-    StopAndArchiveRequest,
-    StopAndArchiveResponse,
-    V2ScriptDeployment,
-    V2ControllerDeployment,
-)
-
-# Trading models
-from .trading import (
-    TradeRequest,
-    TradeResponse,
-    TokenInfo,
-    ConnectorBalance,
-    AccountBalance,
-    PortfolioState,
-    OrderInfo,
-    ActiveOrdersResponse,
-    OrderSummary,
-    TradeInfo,
-    TradingRulesInfo,
-    OrderTypesResponse,
-    OrderFilterRequest,
-    ActiveOrderFilterRequest,
-    PositionFilterRequest,
-    FundingPaymentFilterRequest,
-    TradeFilterRequest,
-)
-
-# Controller models
-from .controllers import (
-    ControllerType,
-    Controller,
-    ControllerResponse,
-    ControllerConfig,
-    ControllerConfigResponse,
-)
-
-# Script models
-from .scripts import (
-    Script,
-    ScriptResponse,
-    ScriptConfig,
-    ScriptConfigResponse,
-)
-
-
-# Market data models
-from .market_data import (
-    CandleData,
-    CandlesResponse,
-    ActiveFeedInfo,
-    ActiveFeedsResponse,
-    MarketDataSettings,
-    TradingRulesResponse,
-    SupportedOrderTypesResponse,
-    # New enhanced market data models
-    PriceRequest,
-    PriceData,
-    PricesResponse,
-    FundingInfoRequest,
-    FundingInfoResponse,
-    OrderBookRequest,
-    OrderBookLevel,
-    OrderBookResponse,
-    OrderBookQueryRequest,
-    VolumeForPriceRequest,
-    PriceForVolumeRequest,
-    QuoteVolumeForPriceRequest,
-    PriceForQuoteVolumeRequest,
-    VWAPForVolumeRequest,
-    OrderBookQueryResult,
-)
-
-# Account models
-from .accounts import (
-    LeverageRequest,
-    PositionModeRequest,
-    CredentialRequest,
-)
 
+Submodules are imported lazily (PEP 562): pydantic compiles a core schema for
+every model class at import time, so deferring each submodule until one of its
+models is first referenced keeps worker cold-start proportional to the models
+actually used.
+"""
 
-# Docker models  
-from .docker import DockerImage
-
-# Backtesting models
-from .backtesting import BacktestingConfig
-
-# Pagination models
-from .pagination import PaginatedResponse, PaginationParams, TimeRangePaginationParams
-
-# Connector models
-from .connectors import (
-    ConnectorInfo,
-    ConnectorConfigMapResponse,
-    TradingRule,
-    ConnectorTradingRulesResponse,
-    ConnectorOrderTypesResponse,
-    ConnectorListResponse,
-)
-
-# Portfolio models
-from .portfolio import (
-    TokenBalance,
-    ConnectorBalances,
-    AccountPortfolioState,
-    PortfolioStateResponse,
-    TokenDistribution,
-    PortfolioDistributionResponse,
-    AccountDistribution,
-    AccountsDistributionResponse,
-    HistoricalPortfolioState,
-    PortfolioHistoryFilters,
-)
-
-# Archived bots models
-from .archived_bots import (
-    OrderStatus,
-    DatabaseStatus,
-    BotSummary,
-    PerformanceMetrics,
-    TradeDetail,
-    OrderDetail,
-    ExecutorInfo,
-    ArchivedBotListResponse,
-    BotPerformanceResponse,
-    TradeHistoryResponse,
-    OrderHistoryResponse,
-    ExecutorsResponse,
-)
-
-__all__ = [
-    # Bot orchestration models
-    "BotAction",
-    "StartBotAction",
-    "StopBotAction",
-    "ImportStrategyAction",
-    "ConfigureBotAction",
-    "ShortcutAction",
-    "BotStatus",
-    "BotHistoryRequest",
-    "BotHistoryResponse",
-    "MQTTStatus",
-    "AllBotsStatusResponse",
-    "StopAndArchiveRequest",
-    "StopAndArchiveResponse",
-    "V2ScriptDeployment",
-    "V2ControllerDeployment",
+from importlib import import_module
+
+# Maps exported name -> defining submodule, used by __getattr__ below.
+_EXPORTS = {
+    # Bot orchestration models (bot lifecycle management)
+    "BotAction": "bot_orchestration",
+    "StartBotAction": "bot_orchestration",
+    "StopBotAction": "bot_orchestration",
+    "ImportStrategyAction": "bot_orchestration",
+    "ConfigureBotAction": "bot_orchestration",
+    "ShortcutAction": "bot_orchestration",
+    "BotStatus": "bot_orchestration",
+    "BotHistoryRequest": "bot_orchestration",
+    "BotHistoryResponse": "bot_orchestration",
+    "MQTTStatus": "bot_orchestration",
+    "AllBotsStatusResponse": "bot_orchestration",
+    "StopAndArchiveRequest": "bot_orchestration",
+    "StopAndArchiveResponse": "bot_orchestration",
+    "V2ScriptDeployment": "bot_orchestration",
+    "V2ControllerDeployment": "bot_orchestration",
     # Trading models
-    "TradeRequest",
-    "TradeResponse",
-    "TokenInfo",
-    "ConnectorBalance",
-    "AccountBalance",
-    "PortfolioState",
-    "OrderInfo",
-    "ActiveOrdersResponse",
-    "OrderSummary",
-    "TradeInfo",
-    "TradingRulesInfo",
-    "OrderTypesResponse",
-    "OrderFilterRequest",
-    "ActiveOrderFilterRequest",
-    "PositionFilterRequest",
-    "FundingPaymentFilterRequest",
-    "TradeFilterRequest",
+    "TradeRequest": "trading",
+    "TradeResponse": "trading",
+    "OrderInfo": "trading",
+    "ActiveOrdersResponse": "trading",
+    "OrderSummary": "trading",
+    "TradeInfo": "trading",
+    "TradingRulesInfo": "trading",
+    "OrderTypesResponse": "trading",
+    "OrderFilterRequest": "trading",
+    "ActiveOrderFilterRequest": "trading",
+    "PositionFilterRequest": "trading",
+    "FundingPaymentFilterRequest": "trading",
+    "TradeFilterRequest": "trading",
     # Controller models
-    "ControllerType",
-    "Controller",
-    "ControllerResponse",
-    "ControllerConfig",
-    "ControllerConfigResponse",
+    "ControllerType": "controllers",
+    "Controller": "controllers",
+    "ControllerResponse": "controllers",
+    "ControllerConfig": "controllers",
+    "ControllerConfigResponse": "controllers",
     # Script models
-    "Script",
-    "ScriptResponse",
-    "ScriptConfig",
-    "ScriptConfigResponse",
+    "Script": "scripts",
+    "ScriptResponse": "scripts",
+    "ScriptConfig": "scripts",
+    "ScriptConfigResponse": "scripts",
     # Market data models
-    "CandleData",
-    "CandlesResponse",
-    "ActiveFeedInfo",
-    "ActiveFeedsResponse",
-    "MarketDataSettings",
-    "TradingRulesResponse",
-    "SupportedOrderTypesResponse",
-    # New enhanced market data models
-    "PriceRequest",
-    "PriceData",
-    "PricesResponse",
-    "FundingInfoRequest",
-    "FundingInfoResponse",
-    "OrderBookRequest",
-    "OrderBookLevel",
-    "OrderBookResponse",
-    "OrderBookQueryRequest",
-    "VolumeForPriceRequest",
-    "PriceForVolumeRequest",
-    "QuoteVolumeForPriceRequest",
-    "PriceForQuoteVolumeRequest",
-    "VWAPForVolumeRequest",
-    "OrderBookQueryResult",
+    "CandleData": "market_data",
+    "CandlesResponse": "market_data",
+    "ActiveFeedInfo": "market_data",
+    "ActiveFeedsResponse": "market_data",
+    "MarketDataSettings": "market_data",
+    "TradingRulesResponse": "market_data",
+    "SupportedOrderTypesResponse": "market_data",
+    "PriceRequest": "market_data",
+    "PriceData": "market_data",
+    "PricesResponse": "market_data",
+    "FundingInfoRequest": "market_data",
+    "FundingInfoResponse": "market_data",
+    "OrderBookRequest": "market_data",
+    "OrderBookLevel": "market_data",
+    "OrderBookResponse": "market_data",
+    "OrderBookQueryRequest": "market_data",
+    "VolumeForPriceRequest": "market_data",
+    "PriceForVolumeRequest": "market_data",
+    "QuoteVolumeForPriceRequest": "market_data",
+    "PriceForQuoteVolumeRequest": "market_data",
+    "VWAPForVolumeRequest": "market_data",
+    "OrderBookQueryResult": "market_data",
     # Account models
-    "LeverageRequest",
-    "PositionModeRequest",
-    "CredentialRequest",
+    "LeverageRequest": "accounts",
+    "PositionModeRequest": "accounts",
+    "CredentialRequest": "accounts",
     # Docker models
-    "DockerImage",
+    "DockerImage": "docker",
     # Backtesting models
-    "BacktestingConfig",
+    "BacktestingConfig": "backtesting",
     # Pagination models
-    "PaginatedResponse",
-    "PaginationParams",
-    "TimeRangePaginationParams",
+    "PaginatedResponse": "pagination",
+    "PaginationParams": "pagination",
+    "TimeRangePaginationParams": "pagination",
     # Connector models
-    "ConnectorInfo",
-    "ConnectorConfigMapResponse",
-    "TradingRule",
-    "ConnectorTradingRulesResponse",
-    "ConnectorOrderTypesResponse",
-    "ConnectorListResponse",
+    "ConnectorInfo": "connectors",
+    "ConnectorConfigMapResponse": "connectors",
+    "TradingRule": "connectors",
+    "ConnectorTradingRulesResponse": "connectors",
+    "ConnectorOrderTypesResponse": "connectors",
+    "ConnectorListResponse": "connectors",
     # Portfolio models
-    "TokenBalance",
-    "ConnectorBalances",
-    "AccountPortfolioState",
-    "PortfolioStateResponse",
-    "TokenDistribution",
-    "PortfolioDistributionResponse",
-    "AccountDistribution",
-    "AccountsDistributionResponse",
-    "HistoricalPortfolioState",
-    "PortfolioHistoryFilters",
+    "TokenBalance": "portfolio",
+    "ConnectorBalances": "portfolio",
+    "AccountPortfolioState": "portfolio",
+    "PortfolioStateResponse": "portfolio",
+    "TokenDistribution": "portfolio",
+    "PortfolioDistributionResponse": "portfolio",
+    "AccountDistribution": "portfolio",
+    "AccountsDistributionResponse": "portfolio",
+    "HistoricalPortfolioState": "portfolio",
+    "PortfolioHistoryFilters": "portfolio",
     # Archived bots models
-    "OrderStatus",
-    "DatabaseStatus",
-    "BotSummary",
-    "PerformanceMetrics",
-    "TradeDetail",
-    "OrderDetail",
-    "ExecutorInfo",
-    "ArchivedBotListResponse",
-    "BotPerformanceResponse",
-    "TradeHistoryResponse",
-    "OrderHistoryResponse",
-    "ExecutorsResponse",
-]
\ No newline at end of file
+    "OrderStatus": "archived_bots",
+    "DatabaseStatus": "archived_bots",
+    "BotSummary": "archived_bots",
+    "PerformanceMetrics": "archived_bots",
+    "TradeDetail": "archived_bots",
+    "OrderDetail": "archived_bots",
+    "ExecutorInfo": "archived_bots",
+    "ArchivedBotListResponse": "archived_bots",
+    "BotPerformanceResponse": "archived_bots",
+    "TradeHistoryResponse": "archived_bots",
+    "OrderHistoryResponse": "archived_bots",
+    "ExecutorsResponse": "archived_bots",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so subsequent lookups skip this hook
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
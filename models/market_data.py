@@ -3,6 +3,7 @@ from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass as pydantic_dataclass
 
 
 class CandleData(BaseModel):
@@ -109,7 +110,10 @@ class OrderBookRequest(BaseModel):
     depth: int = Field(default=10, ge=1, le=1000, description="Number of price levels to return")
 
 
-class OrderBookLevel(BaseModel):
+# Slots + frozen: an order book snapshot allocates hundreds of these per
+# request, and a slotted instance is ~3x smaller than a dict-backed BaseModel.
+@pydantic_dataclass(frozen=True, slots=True)
+class OrderBookLevel:
     """Single order book level"""
     price: float = Field(description="Price level")
     amount: float = Field(description="Amount at this price level")
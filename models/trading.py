@@ -1,13 +1,26 @@
+import sys
 from typing import Dict, List, Optional, Any, Literal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from decimal import Decimal
 from datetime import datetime
 from hummingbot.core.data_type.common import OrderType, TradeType, PositionAction
 from .pagination import PaginationParams, TimeRangePaginationParams
 
+# Shared config for hot-path request/response models: frozen instances avoid
+# per-field setattr machinery and extra="forbid" rejects unknown keys before
+# any field validation work happens.
+RequestConfig = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True, validate_assignment=False)
+
+
+def _intern_str(v):
+    """Intern bounded-vocabulary strings so repeated request values share one object."""
+    return sys.intern(v) if isinstance(v, str) else v
+
 
 class TradeRequest(BaseModel):
     """Request model for placing trades"""
+    model_config = RequestConfig
+
     account_name: str = Field(description="Name of the account to trade with")
     connector_name: str = Field(description="Name of the connector/exchange")
     trading_pair: str = Field(description="Trading pair (e.g., BTC-USDT)")
@@ -17,6 +30,12 @@ class TradeRequest(BaseModel):
     price: Optional[Decimal] = Field(default=None, description="Price for limit orders")
     position_action: Literal["OPEN", "CLOSE"] = Field(default="OPEN", description="Position action for perpetual contracts (OPEN/CLOSE)")
 
+    @field_validator('account_name', 'connector_name', 'trading_pair', mode='before')
+    @classmethod
+    def intern_names(cls, v):
+        """Account/connector/pair names come from small vocabularies; intern them."""
+        return _intern_str(v)
+
     @field_validator('trade_type')
     @classmethod
     def validate_trade_type(cls, v):
@@ -50,6 +69,8 @@ class TradeRequest(BaseModel):
 
 class TradeResponse(BaseModel):
     """Response model for trade execution"""
+    model_config = RequestConfig
+
     order_id: str = Field(description="Client order ID assigned by the connector")
     account_name: str = Field(description="Account used for the trade")
     connector_name: str = Field(description="Connector used for the trade")
@@ -61,31 +82,6 @@ class TradeResponse(BaseModel):
     status: str = Field(default="submitted", description="Order status")
 
 
-class TokenInfo(BaseModel):
-    """Information about a token balance"""
-    token: str = Field(description="Token symbol")
-    balance: Decimal = Field(description="Token balance")
-    value_usd: Optional[Decimal] = Field(None, description="USD value of the balance")
-
-
-class ConnectorBalance(BaseModel):
-    """Balance information for a connector"""
-    connector_name: str = Field(description="Name of the connector")
-    tokens: List[TokenInfo] = Field(description="List of token balances")
-
-
-class AccountBalance(BaseModel):
-    """Balance information for an account"""
-    account_name: str = Field(description="Name of the account")
-    connectors: List[ConnectorBalance] = Field(description="List of connector balances")
-
-
-class PortfolioState(BaseModel):
-    """Complete portfolio state across all accounts"""
-    accounts: List[AccountBalance] = Field(description="List of account balances")
-    timestamp: datetime = Field(description="Timestamp of the portfolio state")
-
-
 class OrderInfo(BaseModel):
     """Information about an order"""
     order_id: str = Field(description="Order ID")
@@ -95,9 +91,9 @@ class OrderInfo(BaseModel):
     trading_pair: str = Field(description="Trading pair")
     order_type: str = Field(description="Order type")
     trade_type: str = Field(description="Trade type (BUY/SELL)")
-    amount: Decimal = Field(description="Order amount")
-    price: Optional[Decimal] = Field(description="Order price")
-    filled_amount: Decimal = Field(description="Filled amount")
+    amount: float = Field(description="Order amount")
+    price: Optional[float] = Field(description="Order price")
+    filled_amount: float = Field(description="Filled amount")
     status: str = Field(description="Order status")
     creation_timestamp: datetime = Field(description="Order creation time")
     last_update_timestamp: datetime = Field(description="Last update time")
@@ -114,8 +110,8 @@ class OrderSummary(BaseModel):
     filled_orders: int = Field(description="Number of filled orders")
     cancelled_orders: int = Field(description="Number of cancelled orders")
     fill_rate: float = Field(description="Order fill rate percentage")
-    total_volume_base: Decimal = Field(description="Total volume in base currency")
-    total_volume_quote: Decimal = Field(description="Total volume in quote currency")
+    total_volume_base: float = Field(description="Total volume in base currency")
+    total_volume_quote: float = Field(description="Total volume in quote currency")
     avg_fill_time: Optional[float] = Field(description="Average fill time in seconds")
 
 
@@ -127,9 +123,9 @@ class TradeInfo(BaseModel):
     connector_name: str = Field(description="Connector name")
     trading_pair: str = Field(description="Trading pair")
     trade_type: str = Field(description="Trade type (BUY/SELL)")
-    amount: Decimal = Field(description="Trade amount")
-    price: Decimal = Field(description="Trade price")
-    fee: Decimal = Field(description="Trade fee")
+    amount: float = Field(description="Trade amount")
+    price: float = Field(description="Trade price")
+    fee: float = Field(description="Trade fee")
     timestamp: datetime = Field(description="Trade timestamp")
 
 
@@ -149,61 +145,51 @@ class OrderTypesResponse(BaseModel):
     supported_order_types: List[str] = Field(description="List of supported order types")
 
 
-class OrderFilterRequest(TimeRangePaginationParams):
-    """Request model for filtering orders with multiple criteria"""
+class AccountConnectorFilter(BaseModel):
+    """Shared account/connector filter fields, compiled into a core schema once
+    and reused by every filter request model below."""
+    model_config = RequestConfig
     account_names: Optional[List[str]] = Field(default=None, description="List of account names to filter by")
     connector_names: Optional[List[str]] = Field(default=None, description="List of connector names to filter by")
+
+
+class OrderFilterRequest(AccountConnectorFilter, TimeRangePaginationParams):
+    """Request model for filtering orders with multiple criteria"""
     trading_pairs: Optional[List[str]] = Field(default=None, description="List of trading pairs to filter by")
     status: Optional[str] = Field(default=None, description="Order status filter")
 
 
-class ActiveOrderFilterRequest(PaginationParams):
+class ActiveOrderFilterRequest(AccountConnectorFilter, PaginationParams):
     """Request model for filtering active orders"""
-    account_names: Optional[List[str]] = Field(default=None, description="List of account names to filter by")
-    connector_names: Optional[List[str]] = Field(default=None, description="List of connector names to filter by")
     trading_pairs: Optional[List[str]] = Field(default=None, description="List of trading pairs to filter by")
 
 
-class PositionFilterRequest(PaginationParams):
+class PositionFilterRequest(AccountConnectorFilter, PaginationParams):
     """Request model for filtering positions"""
-    account_names: Optional[List[str]] = Field(default=None, description="List of account names to filter by")
-    connector_names: Optional[List[str]] = Field(default=None, description="List of connector names to filter by")
 
 
-class FundingPaymentFilterRequest(TimeRangePaginationParams):
+class FundingPaymentFilterRequest(AccountConnectorFilter, TimeRangePaginationParams):
     """Request model for filtering funding payments"""
-    account_names: Optional[List[str]] = Field(default=None, description="List of account names to filter by")
-    connector_names: Optional[List[str]] = Field(default=None, description="List of connector names to filter by")
     trading_pair: Optional[str] = Field(default=None, description="Filter by trading pair")
 
 
-class TradeFilterRequest(TimeRangePaginationParams):
+class TradeFilterRequest(AccountConnectorFilter, TimeRangePaginationParams):
     """Request model for filtering trades"""
-    account_names: Optional[List[str]] = Field(default=None, description="List of account names to filter by")
-    connector_names: Optional[List[str]] = Field(default=None, description="List of connector names to filter by")
     trading_pairs: Optional[List[str]] = Field(default=None, description="List of trading pairs to filter by")
     trade_types: Optional[List[str]] = Field(default=None, description="List of trade types to filter by (BUY/SELL)")
 
 
-class PortfolioStateFilterRequest(BaseModel):
+class PortfolioStateFilterRequest(AccountConnectorFilter):
     """Request model for filtering portfolio state"""
-    account_names: Optional[List[str]] = Field(default=None, description="List of account names to filter by")
-    connector_names: Optional[List[str]] = Field(default=None, description="List of connector names to filter by")
 
 
-class PortfolioHistoryFilterRequest(TimeRangePaginationParams):
+class PortfolioHistoryFilterRequest(AccountConnectorFilter, TimeRangePaginationParams):
     """Request model for filtering portfolio history"""
-    account_names: Optional[List[str]] = Field(default=None, description="List of account names to filter by")
-    connector_names: Optional[List[str]] = Field(default=None, description="List of connector names to filter by")
 
 
-class PortfolioDistributionFilterRequest(BaseModel):
+class PortfolioDistributionFilterRequest(AccountConnectorFilter):
     """Request model for filtering portfolio distribution"""
-    account_names: Optional[List[str]] = Field(default=None, description="List of account names to filter by")
-    connector_names: Optional[List[str]] = Field(default=None, description="List of connector names to filter by")
 
 
-class AccountsDistributionFilterRequest(BaseModel):
-    """Request model for filtering accounts distribution"""
-    account_names: Optional[List[str]] = Field(default=None, description="List of account names to filter by")
-    connector_names: Optional[List[str]] = Field(default=None, description="List of connector names to filter by")
\ No newline at end of file
+class AccountsDistributionFilterRequest(AccountConnectorFilter):
+    """Request model for filtering accounts distribution"""
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Depends, Query
@@ -7,6 +7,7 @@ from starlette import status
 from services.accounts_service import AccountsService
 from deps import get_accounts_service
 from models import PaginatedResponse
+from utils.errors import api_error_boundary
 
 router = APIRouter(tags=["Accounts"], prefix="/accounts")
 
@@ -23,6 +24,7 @@ async def list_accounts(accounts_service: AccountsService = Depends(get_accounts
 
 
 @router.get("/{account_name}/credentials", response_model=List[str])
+@api_error_boundary
 async def list_account_credentials(account_name: str,
                                    accounts_service: AccountsService = Depends(get_accounts_service)):
     """
@@ -37,17 +39,13 @@ async def list_account_credentials(account_name: str,
     Raises:
         HTTPException: 404 if account not found
     """
-    try:
-        credentials = accounts_service.list_credentials(account_name)
-        # Remove .yml extension from filenames
-        return [cred.replace('.yml', '') for cred in credentials]
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    credentials = accounts_service.list_credentials(account_name)
+    # Remove .yml extension from filenames
+    return [cred.replace('.yml', '') for cred in credentials]
 
 
 @router.post("/add-account", status_code=status.HTTP_201_CREATED)
+@api_error_boundary
 async def add_account(account_name: str, accounts_service: AccountsService = Depends(get_accounts_service)):
     """
     Create a new account with default configuration files.
@@ -61,14 +59,12 @@ async def add_account(account_name: str, accounts_service: AccountsService = Dep
     Raises:
         HTTPException: 400 if account already exists
     """
-    try:
-        accounts_service.add_account(account_name)
-        return {"message": "Account added successfully."}
-    except FileExistsError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    accounts_service.add_account(account_name)
+    return {"message": "Account added successfully."}
 
 
 @router.post("/delete-account")
+@api_error_boundary
 async def delete_account(account_name: str, accounts_service: AccountsService = Depends(get_accounts_service)):
     """
     Delete an account and all its associated credentials.
@@ -82,16 +78,14 @@ async def delete_account(account_name: str, accounts_service: AccountsService =
     Raises:
         HTTPException: 400 if trying to delete master account, 404 if account not found
     """
-    try:
-        if account_name == "master_account":
-            raise HTTPException(status_code=400, detail="Cannot delete master account.")
-        await accounts_service.delete_account(account_name)
-        return {"message": "Account deleted successfully."}
-    except FileNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    if account_name == "master_account":
+        raise HTTPException(status_code=400, detail="Cannot delete master account.")
+    await accounts_service.delete_account(account_name)
+    return {"message": "Account deleted successfully."}
 
 
 @router.post("/delete-credential/{account_name}/{connector_name}")
+@api_error_boundary
 async def delete_credential(account_name: str, connector_name: str, accounts_service: AccountsService = Depends(get_accounts_service)):
     """
     Delete a specific connector credential for an account.
@@ -106,15 +100,12 @@ async def delete_credential(account_name: str, connector_name: str, accounts_ser
     Raises:
         HTTPException: 404 if credential not found
     """
-    try:
-        await accounts_service.delete_credentials(account_name, connector_name)
-        return {"message": "Credential deleted successfully."}
-    except FileNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    await accounts_service.delete_credentials(account_name, connector_name)
+    return {"message": "Credential deleted successfully."}
 
 
 @router.post("/add-credential/{account_name}/{connector_name}", status_code=status.HTTP_201_CREATED)
-async def add_credential(account_name: str, connector_name: str, credentials: Dict, accounts_service: AccountsService = Depends(get_accounts_service)):
+async def add_credential(account_name: str, connector_name: str, credentials: Dict[str, Any], accounts_service: AccountsService = Depends(get_accounts_service)):
     """
     Add or update connector credentials (API keys) for a specific account and connector.
     
@@ -129,6 +120,10 @@ async def add_credential(account_name: str, connector_name: str, credentials: Di
     Raises:
         HTTPException: 400 if there's an error adding the credentials
     """
+    # Fail fast on a vacuous payload before touching the keystore or
+    # spinning up a connector just to watch it fail validation
+    if not credentials:
+        raise HTTPException(status_code=400, detail="credentials must be non-empty")
     try:
         await accounts_service.add_credentials(account_name, connector_name, credentials)
         return {"message": "Connector credentials added successfully."}
@@ -1,6 +1,10 @@
 from typing import List, Optional
+
+import orjson
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
+from utils.errors import api_error_boundary
 from utils.file_system import fs_util
 from utils.hummingbot_database_reader import HummingbotDatabase
 
@@ -41,6 +45,7 @@ async def get_database_status(db_path: str):
 
 
 @router.get("/{db_path:path}/summary")
+@api_error_boundary(error_prefix="Error analyzing database")
 async def get_database_summary(db_path: str):
     """
     Get a summary of database contents including basic statistics.
@@ -51,31 +56,29 @@ async def get_database_summary(db_path: str):
     Returns:
         Summary statistics of the database contents
     """
-    try:
-        db = HummingbotDatabase(db_path)
-        
-        # Get basic counts
-        orders = db.get_orders()
-        trades = db.get_trade_fills()
-        executors = db.get_executors_data()
-        positions = db.get_positions()
-        controllers = db.get_controllers_data()
-        
-        return {
-            "db_path": db_path,
-            "total_orders": len(orders),
-            "total_trades": len(trades),
-            "total_executors": len(executors),
-            "total_positions": len(positions),
-            "total_controllers": len(controllers),
-            "trading_pairs": orders["trading_pair"].unique().tolist() if len(orders) > 0 else [],
-            "exchanges": orders["connector_name"].unique().tolist() if len(orders) > 0 else [],
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error analyzing database: {str(e)}")
+    db = HummingbotDatabase(db_path)
+    
+    # Get basic counts
+    orders = db.get_orders()
+    trades = db.get_trade_fills()
+    executors = db.get_executors_data()
+    positions = db.get_positions()
+    controllers = db.get_controllers_data()
+    
+    return {
+        "db_path": db_path,
+        "total_orders": len(orders),
+        "total_trades": len(trades),
+        "total_executors": len(executors),
+        "total_positions": len(positions),
+        "total_controllers": len(controllers),
+        "trading_pairs": orders["trading_pair"].unique().tolist() if len(orders) > 0 else [],
+        "exchanges": orders["connector_name"].unique().tolist() if len(orders) > 0 else [],
+    }
 
 
 @router.get("/{db_path:path}/performance")
+@api_error_boundary(error_prefix="Error calculating performance")
 async def get_database_performance(db_path: str):
     """
     Get trade-based performance analysis for a bot database.
@@ -86,131 +89,145 @@ async def get_database_performance(db_path: str):
     Returns:
         Trade-based performance metrics with rolling calculations
     """
-    try:
-        db = HummingbotDatabase(db_path)
-        
-        # Use new trade-based performance calculation
-        performance_data = db.calculate_trade_based_performance()
-        
-        if len(performance_data) == 0:
-            return {
-                "db_path": db_path,
-                "error": "No trades found in database",
-                "performance_data": []
-            }
-        
-        # Convert to records for JSON response
-        performance_records = performance_data.fillna(0).to_dict('records')
-        
-        # Calculate summary statistics
-        final_row = performance_data.iloc[-1] if len(performance_data) > 0 else {}
-        summary = {
-            "total_trades": len(performance_data),
-            "final_net_pnl_quote": float(final_row.get('net_pnl_quote', 0)),
-            "final_realized_pnl_quote": float(final_row.get('realized_trade_pnl_quote', 0)), 
-            "final_unrealized_pnl_quote": float(final_row.get('unrealized_trade_pnl_quote', 0)),
-            "total_fees_quote": float(performance_data['fees_quote'].sum()),
-            "total_volume_quote": float(performance_data['cum_volume_quote'].iloc[-1] if len(performance_data) > 0 else 0),
-            "final_net_position": float(final_row.get('net_position', 0)),
-            "trading_pairs": performance_data['trading_pair'].unique().tolist(),
-            "connector_names": performance_data['connector_name'].unique().tolist()
-        }
-        
+    db = HummingbotDatabase(db_path)
+    
+    # Use new trade-based performance calculation
+    performance_data = db.calculate_trade_based_performance()
+    
+    if len(performance_data) == 0:
         return {
             "db_path": db_path,
-            "summary": summary,
-            "performance_data": performance_records
+            "error": "No trades found in database",
+            "performance_data": []
         }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error calculating performance: {str(e)}")
+    
+    # Convert to records for JSON response
+    performance_records = performance_data.fillna(0).to_dict('records')
+    
+    # Calculate summary statistics
+    final_row = performance_data.iloc[-1] if len(performance_data) > 0 else {}
+    summary = {
+        "total_trades": len(performance_data),
+        "final_net_pnl_quote": float(final_row.get('net_pnl_quote', 0)),
+        "final_realized_pnl_quote": float(final_row.get('realized_trade_pnl_quote', 0)), 
+        "final_unrealized_pnl_quote": float(final_row.get('unrealized_trade_pnl_quote', 0)),
+        "total_fees_quote": float(performance_data['fees_quote'].sum()),
+        "total_volume_quote": float(performance_data['cum_volume_quote'].iloc[-1] if len(performance_data) > 0 else 0),
+        "final_net_position": float(final_row.get('net_position', 0)),
+        "trading_pairs": performance_data['trading_pair'].unique().tolist(),
+        "connector_names": performance_data['connector_name'].unique().tolist()
+    }
+    
+    return {
+        "db_path": db_path,
+        "summary": summary,
+        "performance_data": performance_records
+    }
+    
 
 
 @router.get("/{db_path:path}/trades")
+@api_error_boundary(error_prefix="Error fetching trades")
 async def get_database_trades(
     db_path: str,
     limit: int = Query(default=100, description="Limit number of trades returned"),
-    offset: int = Query(default=0, description="Offset for pagination")
+    offset: int = Query(default=0, description="Offset for pagination"),
+    stream: bool = Query(default=False, description="Stream the full trade history as NDJSON instead of a paginated page")
 ):
     """
     Get trade history from a database.
-    
+
     Args:
         db_path: Full path to the database file
         limit: Maximum number of trades to return
         offset: Offset for pagination
-        
+        stream: If true, stream every trade as one NDJSON row per line
+
     Returns:
-        List of trades with pagination info
+        List of trades with pagination info, or an NDJSON stream when stream=true
     """
-    try:
-        db = HummingbotDatabase(db_path)
-        trades = db.get_trade_fills()
-        
-        # Apply pagination
-        total_trades = len(trades)
-        trades_page = trades.iloc[offset:offset + limit]
-        
-        return {
-            "db_path": db_path,
-            "trades": trades_page.fillna(0).to_dict('records'),
-            "pagination": {
-                "total": total_trades,
-                "limit": limit,
-                "offset": offset,
-                "has_more": offset + limit < total_trades
-            }
+    db = HummingbotDatabase(db_path)
+    trades = db.get_trade_fills()
+
+    if stream:
+        # Emit row by row so the response never materializes the whole
+        # history as one JSON document in memory
+        rows = trades.fillna(0).to_dict('records')
+
+        async def iter_trades():
+            for row in rows:
+                yield orjson.dumps(row, default=str) + b"\n"
+
+        return StreamingResponse(iter_trades(), media_type="application/x-ndjson")
+
+    # Apply pagination
+    total_trades = len(trades)
+    trades_page = trades.iloc[offset:offset + limit]
+    
+    return {
+        "db_path": db_path,
+        "trades": trades_page.fillna(0).to_dict('records'),
+        "pagination": {
+            "total": total_trades,
+            "limit": limit,
+            "offset": offset,
+            "has_more": offset + limit < total_trades
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching trades: {str(e)}")
+    }
 
 
 @router.get("/{db_path:path}/orders")
+@api_error_boundary(error_prefix="Error fetching orders")
 async def get_database_orders(
     db_path: str,
     limit: int = Query(default=100, description="Limit number of orders returned"),
     offset: int = Query(default=0, description="Offset for pagination"),
-    status: Optional[str] = Query(default=None, description="Filter by order status")
+    status: Optional[str] = Query(default=None, description="Filter by order status"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of columns to return")
 ):
     """
     Get order history from a database.
-    
+
     Args:
         db_path: Full path to the database file
         limit: Maximum number of orders to return
         offset: Offset for pagination
         status: Optional status filter
-        
+        fields: Optional comma-separated column projection to cut payload size
+
     Returns:
         List of orders with pagination info
     """
-    try:
-        db = HummingbotDatabase(db_path)
-        orders = db.get_orders()
-        
-        # Apply status filter if provided
-        if status:
-            orders = orders[orders["last_status"] == status]
-        
-        # Apply pagination
-        total_orders = len(orders)
-        orders_page = orders.iloc[offset:offset + limit]
-        
-        return {
-            "db_path": db_path,
-            "orders": orders_page.fillna(0).to_dict('records'),
-            "pagination": {
-                "total": total_orders,
-                "limit": limit,
-                "offset": offset,
-                "has_more": offset + limit < total_orders
-            }
+    db = HummingbotDatabase(db_path)
+    orders = db.get_orders()
+
+    # Apply status filter if provided
+    if status:
+        orders = orders[orders["last_status"] == status]
+
+    # Project to the requested columns before serializing anything
+    if fields:
+        wanted = [col for col in fields.split(",") if col in orders.columns]
+        orders = orders[wanted]
+
+    # Apply pagination
+    total_orders = len(orders)
+    orders_page = orders.iloc[offset:offset + limit]
+    
+    return {
+        "db_path": db_path,
+        "orders": orders_page.fillna(0).to_dict('records'),
+        "pagination": {
+            "total": total_orders,
+            "limit": limit,
+            "offset": offset,
+            "has_more": offset + limit < total_orders
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching orders: {str(e)}")
+    }
 
 
 @router.get("/{db_path:path}/executors")
+@api_error_boundary(error_prefix="Error fetching executors")
 async def get_database_executors(db_path: str):
     """
     Get executor data from a database.
@@ -221,59 +238,68 @@ async def get_database_executors(db_path: str):
     Returns:
         List of executors with their configurations and results
     """
-    try:
-        db = HummingbotDatabase(db_path)
-        executors = db.get_executors_data()
-        
-        return {
-            "db_path": db_path,
-            "executors": executors.fillna(0).to_dict('records'),
-            "total": len(executors)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching executors: {str(e)}")
+    db = HummingbotDatabase(db_path)
+    executors = db.get_executors_data()
+    
+    return {
+        "db_path": db_path,
+        "executors": executors.fillna(0).to_dict('records'),
+        "total": len(executors)
+    }
 
 
 @router.get("/{db_path:path}/positions")
+@api_error_boundary(error_prefix="Error fetching positions")
 async def get_database_positions(
     db_path: str,
     limit: int = Query(default=100, description="Limit number of positions returned"),
-    offset: int = Query(default=0, description="Offset for pagination")
+    offset: int = Query(default=0, description="Offset for pagination"),
+    stream: bool = Query(default=False, description="Stream the full position history as NDJSON instead of a paginated page")
 ):
     """
     Get position data from a database.
-    
+
     Args:
         db_path: Full path to the database file
         limit: Maximum number of positions to return
         offset: Offset for pagination
-        
+        stream: If true, stream every position as one NDJSON row per line
+
     Returns:
-        List of positions with pagination info
+        List of positions with pagination info, or an NDJSON stream when stream=true
     """
-    try:
-        db = HummingbotDatabase(db_path)
-        positions = db.get_positions()
-        
-        # Apply pagination
-        total_positions = len(positions)
-        positions_page = positions.iloc[offset:offset + limit]
-        
-        return {
-            "db_path": db_path,
-            "positions": positions_page.fillna(0).to_dict('records'),
-            "pagination": {
-                "total": total_positions,
-                "limit": limit,
-                "offset": offset,
-                "has_more": offset + limit < total_positions
-            }
+    db = HummingbotDatabase(db_path)
+    positions = db.get_positions()
+
+    if stream:
+        # Emit row by row so the response never materializes the whole
+        # history as one JSON document in memory
+        rows = positions.fillna(0).to_dict('records')
+
+        async def iter_positions():
+            for row in rows:
+                yield orjson.dumps(row, default=str) + b"\n"
+
+        return StreamingResponse(iter_positions(), media_type="application/x-ndjson")
+
+    # Apply pagination
+    total_positions = len(positions)
+    positions_page = positions.iloc[offset:offset + limit]
+    
+    return {
+        "db_path": db_path,
+        "positions": positions_page.fillna(0).to_dict('records'),
+        "pagination": {
+            "total": total_positions,
+            "limit": limit,
+            "offset": offset,
+            "has_more": offset + limit < total_positions
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching positions: {str(e)}")
+    }
 
 
 @router.get("/{db_path:path}/controllers")
+@api_error_boundary(error_prefix="Error fetching controllers")
 async def get_database_controllers(db_path: str):
     """
     Get controller data from a database.
@@ -284,14 +310,11 @@ async def get_database_controllers(db_path: str):
     Returns:
         List of controllers that were running with their configurations
     """
-    try:
-        db = HummingbotDatabase(db_path)
-        controllers = db.get_controllers_data()
-        
-        return {
-            "db_path": db_path,
-            "controllers": controllers.fillna(0).to_dict('records'),
-            "total": len(controllers)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching controllers: {str(e)}")
+    db = HummingbotDatabase(db_path)
+    controllers = db.get_controllers_data()
+    
+    return {
+        "db_path": db_path,
+        "controllers": controllers.fillna(0).to_dict('records'),
+        "total": len(controllers)
+    }
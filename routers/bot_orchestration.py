@@ -13,6 +13,7 @@ from services.docker_service import DockerService
 from deps import get_bots_orchestrator, get_docker_service, get_bot_archiver, get_database_manager
 from utils.file_system import fs_util
 from utils.bot_archiver import BotArchiver
+from utils.responses import ORJSONResponse
 from database import AsyncDatabaseManager, BotRunRepository
 
 router = APIRouter(tags=["Bot Orchestration"], prefix="/bot-orchestration")
@@ -29,7 +30,9 @@ def get_active_bots_status(bots_manager: BotsOrchestrator = Depends(get_bots_orc
     Returns:
         Dictionary with status and data containing all active bot statuses
     """
-    return {"status": "success", "data": bots_manager.get_all_bots_status()}
+    # Bot statuses carry performance snapshots and recent logs for every bot;
+    # serialize straight through orjson instead of the jsonable_encoder walk
+    return ORJSONResponse({"status": "success", "data": bots_manager.get_all_bots_status()})
 
 
 @router.get("/mqtt")
@@ -82,10 +85,10 @@ def get_bot_status(bot_name: str, bots_manager: BotsOrchestrator = Depends(get_b
     response = bots_manager.get_bot_status(bot_name)
     if not response:
         raise HTTPException(status_code=404, detail="Bot not found")
-    return {
+    return ORJSONResponse({
         "status": "success",
         "data": response
-    }
+    })
 
 
 @router.get("/{bot_name}/history")
@@ -402,10 +405,10 @@ async def _background_stop_and_archive(
         
         for i in range(max_retries):
             logger.info(f"Attempting to stop container {container_name} (attempt {i+1}/{max_retries})")
-            docker_manager.stop_container(container_name)
-                
+            await asyncio.to_thread(docker_manager.stop_container, container_name)
+
             # Check if container is already stopped
-            container_status = docker_manager.get_container_status(container_name)
+            container_status = await asyncio.to_thread(docker_manager.get_container_status, container_name)
             if container_status.get("state", {}).get("status") == "exited":
                 container_stopped = True
                 logger.info(f"Container {container_name} is already stopped")
@@ -422,10 +425,12 @@ async def _background_stop_and_archive(
         logger.info(f"Archiving bot data from {instance_dir}")
         
         try:
+            # Compression/moves/uploads are blocking; run them in a worker
+            # thread so the background task doesn't stall the event loop
             if archive_locally:
-                bot_archiver.archive_locally(container_name, instance_dir)
+                await asyncio.to_thread(bot_archiver.archive_locally, container_name, instance_dir)
             else:
-                bot_archiver.archive_and_upload(container_name, instance_dir, bucket_name=s3_bucket)
+                await asyncio.to_thread(bot_archiver.archive_and_upload, container_name, instance_dir, bucket_name=s3_bucket)
             logger.info(f"Successfully archived bot data for {container_name}")
         except Exception as e:
             logger.error(f"Archive failed: {str(e)}")
@@ -433,12 +438,12 @@ async def _background_stop_and_archive(
             
         # Step 7: Remove the container
         logging.info(f"Removing container {container_name}")
-        remove_response = docker_manager.remove_container(container_name, force=False)
-        
+        remove_response = await asyncio.to_thread(docker_manager.remove_container, container_name, force=False)
+
         if not remove_response.get("success"):
             # If graceful remove fails, try force remove
             logging.warning("Graceful container removal failed, attempting force removal")
-            remove_response = docker_manager.remove_container(container_name, force=True)
+            remove_response = await asyncio.to_thread(docker_manager.remove_container, container_name, force=True)
         
         if remove_response.get("success"):
             logging.info(f"Successfully completed stop-and-archive for bot {bot_name}")
@@ -594,7 +599,9 @@ async def deploy_v2_script(
         Dictionary with creation response and instance details
     """
     logging.info(f"Creating hummingbot instance with config: {config}")
-    response = docker_manager.create_hummingbot_instance(config)
+    # Instance creation copies credentials and runs the container - blocking
+    # filesystem and daemon work that belongs in a worker thread
+    response = await asyncio.to_thread(docker_manager.create_hummingbot_instance, config)
     
     # Track bot run if deployment was successful
     if response.get("success"):
@@ -684,7 +691,7 @@ async def deploy_v2_controllers(
         )
         
         # Deploy the instance using the existing method
-        response = docker_manager.create_hummingbot_instance(instance_config)
+        response = await asyncio.to_thread(docker_manager.create_hummingbot_instance, instance_config)
         
         if response.get("success"):
             response["script_config_generated"] = script_config_filename
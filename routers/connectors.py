@@ -6,6 +6,7 @@ from hummingbot.client.settings import AllConnectorSettings
 from services.accounts_service import AccountsService
 from services.market_data_feed_manager import MarketDataFeedManager
 from deps import get_accounts_service
+from utils.errors import api_error_boundary
 
 router = APIRouter(tags=["Connectors"], prefix="/connectors")
 
@@ -36,6 +37,7 @@ async def get_connector_config_map(connector_name: str, accounts_service: Accoun
 
 
 @router.get("/{connector_name}/trading-rules")
+@api_error_boundary(error_prefix="Error retrieving trading rules")
 async def get_trading_rules(
     request: Request, 
     connector_name: str,
@@ -58,24 +60,19 @@ async def get_trading_rules(
     Raises:
         HTTPException: 404 if connector not found, 500 for other errors
     """
-    try:
-        market_data_feed_manager: MarketDataFeedManager = request.app.state.market_data_feed_manager
-        
-        # Get trading rules (filtered by trading pairs if provided)
-        rules = await market_data_feed_manager.get_trading_rules(connector_name, trading_pairs)
-        
-        if "error" in rules:
-            raise HTTPException(status_code=404, detail=f"Connector '{connector_name}' not found or error: {rules['error']}")
-        
-        return rules
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving trading rules: {str(e)}")
+    market_data_feed_manager: MarketDataFeedManager = request.app.state.market_data_feed_manager
+
+    # Get trading rules (filtered by trading pairs if provided)
+    rules = await market_data_feed_manager.get_trading_rules(connector_name, trading_pairs)
+
+    if "error" in rules:
+        raise HTTPException(status_code=404, detail=f"Connector '{connector_name}' not found or error: {rules['error']}")
+
+    return rules
 
 
 @router.get("/{connector_name}/order-types")
+@api_error_boundary(error_prefix="Error retrieving order types")
 async def get_supported_order_types(request: Request, connector_name: str):
     """
     Get order types supported by a specific connector.
@@ -93,23 +90,17 @@ async def get_supported_order_types(request: Request, connector_name: str):
     Raises:
         HTTPException: 404 if connector not found, 500 for other errors
     """
-    try:
-        market_data_feed_manager: MarketDataFeedManager = request.app.state.market_data_feed_manager
-        
-        # Access connector through MarketDataProvider's _rate_sources
-        connector_instance = market_data_feed_manager.market_data_provider._rate_sources.get(connector_name)
-        
-        if not connector_instance:
-            raise HTTPException(status_code=404, detail=f"Connector '{connector_name}' not found")
-        
-        # Get supported order types
-        if hasattr(connector_instance, 'supported_order_types'):
-            order_types = [order_type.name for order_type in connector_instance.supported_order_types()]
-            return {"connector": connector_name, "supported_order_types": order_types}
-        else:
-            raise HTTPException(status_code=404, detail=f"Connector '{connector_name}' does not support order types query")
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving order types: {str(e)}")
\ No newline at end of file
+    market_data_feed_manager: MarketDataFeedManager = request.app.state.market_data_feed_manager
+
+    # Access connector through MarketDataProvider's _rate_sources
+    connector_instance = market_data_feed_manager.market_data_provider._rate_sources.get(connector_name)
+
+    if not connector_instance:
+        raise HTTPException(status_code=404, detail=f"Connector '{connector_name}' not found")
+
+    # Get supported order types
+    if hasattr(connector_instance, 'supported_order_types'):
+        order_types = [order_type.name for order_type in connector_instance.supported_order_types()]
+        return {"connector": connector_name, "supported_order_types": order_types}
+    else:
+        raise HTTPException(status_code=404, detail=f"Connector '{connector_name}' does not support order types query")
\ No newline at end of file
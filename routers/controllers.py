@@ -1,7 +1,8 @@
-import json
-import yaml
 from typing import Dict, List
 
+import orjson
+import yaml
+
 from fastapi import APIRouter, HTTPException
 from starlette import status
 
@@ -245,7 +246,9 @@ async def get_controller_config_template(controller_type: ControllerType, contro
                             "type": field.annotation,
                             "required": field.required if hasattr(field, 'required') else False,
                             } for name, field in config_class.model_fields.items()}
-    return json.loads(json.dumps(config_fields, default=str))
+    # Round-trip through orjson to stringify non-JSON-native defaults
+    # (Decimal, enums, ...) in one Rust-backed pass instead of stdlib json
+    return orjson.loads(orjson.dumps(config_fields, default=str))
 
 @router.post("/{controller_type}/{controller_name}/config/validate")
 async def validate_controller_config(controller_type: ControllerType, controller_name: str, config: Dict):
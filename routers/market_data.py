@@ -1,7 +1,9 @@
 import asyncio
 import time
+from typing import List
 
 from fastapi import APIRouter, Request, HTTPException, Depends
+from pydantic import TypeAdapter
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig, CandlesConfig
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 
@@ -17,6 +19,10 @@ from deps import get_market_data_feed_manager
 
 router = APIRouter(tags=["Market Data"], prefix="/market-data")
 
+# Compiled once at import; validates a whole side of the book in a single
+# pydantic-core call instead of one model __init__ per level.
+ORDER_BOOK_LEVELS_ADAPTER = TypeAdapter(List[OrderBookLevel])
+
 
 @router.post("/candles")
 async def get_candles(request: Request, candles_config: CandlesConfigRequest):
@@ -253,10 +259,16 @@ async def get_order_book(
             raise HTTPException(status_code=500, detail=order_book_data["error"])
             
         # Convert to response format - data comes as [price, amount] lists
-        bids = [OrderBookLevel(price=bid[0], amount=bid[1]) for bid in order_book_data["bids"]]
-        asks = [OrderBookLevel(price=ask[0], amount=ask[1]) for ask in order_book_data["asks"]]
+        bids = ORDER_BOOK_LEVELS_ADAPTER.validate_python(
+            [{"price": bid[0], "amount": bid[1]} for bid in order_book_data["bids"]]
+        )
+        asks = ORDER_BOOK_LEVELS_ADAPTER.validate_python(
+            [{"price": ask[0], "amount": ask[1]} for ask in order_book_data["asks"]]
+        )
         
-        return OrderBookResponse(
+        # Levels were just batch-validated by the adapter; construct the
+        # envelope without re-running field validation over them
+        return OrderBookResponse.model_construct(
             trading_pair=order_book_data["trading_pair"],
             bids=bids,
             asks=asks,
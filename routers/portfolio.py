@@ -1,7 +1,14 @@
-from typing import Dict, List, Optional
+import asyncio
+import logging
+from heapq import merge
+from itertools import islice
+from operator import itemgetter
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Depends
+import numpy as np
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from models.trading import (
     PortfolioStateFilterRequest,
@@ -12,11 +19,30 @@ from models.trading import (
 from services.accounts_service import AccountsService
 from deps import get_accounts_service
 from models import PaginatedResponse
+from utils.responses import ORJSONResponse
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Portfolio"], prefix="/portfolio")
 
+# Below this many tokens a streamed distribution buys nothing, so small
+# payloads fall back to a regular JSON response even when streaming is asked for
+_STREAM_DISTRIBUTION_MIN_TOKENS = 500
+
+
+def _filter_history_connectors(rows: list, wanted_connectors: frozenset) -> None:
+    """Trim each history row's connectors in place to the requested set."""
+    for item in rows:
+        for account_data in item.values():
+            if isinstance(account_data, dict) and "connectors" in account_data:
+                connectors = account_data["connectors"]
+                account_data["connectors"] = {
+                    connector_name: connectors[connector_name]
+                    for connector_name in connectors.keys() & wanted_connectors
+                }
+
 
-@router.post("/state", response_model=Dict[str, Dict[str, List[Dict]]])
+@router.post("/state")
 async def get_portfolio_state(
     filter_request: PortfolioStateFilterRequest,
     accounts_service: AccountsService = Depends(get_accounts_service)
@@ -30,32 +56,43 @@ async def get_portfolio_state(
     Returns:
         Dict containing account states with connector balances and token information
     """
-    await accounts_service.update_account_state()
+    # The background update loop keeps accounts_state fresh on an interval;
+    # re-refreshing every connector per request just stacks round-trips in
+    # front of what is effectively a cached read
     all_states = accounts_service.get_accounts_state()
-    
-    # Apply account name filter first
+
+    # Resolve the account filter to the names actually present, then apply
+    # both filters in a single pass instead of rebuilding the dict once per
+    # filter (connectors are at the top level of each account's data)
     if filter_request.account_names:
+        accounts = [name for name in filter_request.account_names if name in all_states]
+    else:
+        accounts = all_states
+
+    if filter_request.connector_names:
+        wanted_connectors = frozenset(filter_request.connector_names)
         filtered_states = {}
-        for account_name in filter_request.account_names:
-            if account_name in all_states:
-                filtered_states[account_name] = all_states[account_name]
+        for account_name in accounts:
+            account_data = all_states[account_name]
+            if wanted_connectors >= account_data.keys():
+                # Filter already covers every connector - reuse the dict
+                # instead of rebuilding an identical copy
+                filtered_states[account_name] = account_data
+            else:
+                filtered_states[account_name] = {
+                    connector_name: account_data[connector_name]
+                    for connector_name in wanted_connectors & account_data.keys()
+                }
         all_states = filtered_states
-    
-    # Apply connector filter if specified
-    if filter_request.connector_names:
-        for account_name, account_data in all_states.items():
-            # Filter connectors directly (they are at the top level of account_data)
-            filtered_connectors = {}
-            for connector_name in filter_request.connector_names:
-                if connector_name in account_data:
-                    filtered_connectors[connector_name] = account_data[connector_name]
-            # Replace account_data with only filtered connectors
-            all_states[account_name] = filtered_connectors
-    
-    return all_states
+    elif filter_request.account_names:
+        all_states = {account_name: all_states[account_name] for account_name in accounts}
 
+    # Return the response directly so FastAPI skips the jsonable_encoder walk
+    # over what is already a plain dict-of-floats payload
+    return ORJSONResponse(all_states)
 
-@router.post("/history", response_model=PaginatedResponse)
+
+@router.post("/history", responses={200: {"model": PaginatedResponse}})
 async def get_portfolio_history(
     filter_request: PortfolioHistoryFilterRequest,
     accounts_service: AccountsService = Depends(get_accounts_service)
@@ -73,7 +110,9 @@ async def get_portfolio_history(
         # Convert integer timestamps to datetime objects
         start_time_dt = datetime.fromtimestamp(filter_request.start_time / 1000) if filter_request.start_time else None
         end_time_dt = datetime.fromtimestamp(filter_request.end_time / 1000) if filter_request.end_time else None
-        
+
+        wanted_connectors = frozenset(filter_request.connector_names) if filter_request.connector_names else None
+
         if not filter_request.account_names:
             # Get history for all accounts
             data, next_cursor, has_more = await accounts_service.load_account_state_history(
@@ -82,10 +121,14 @@ async def get_portfolio_history(
                 start_time=start_time_dt,
                 end_time=end_time_dt
             )
+            if wanted_connectors is not None:
+                _filter_history_connectors(data, wanted_connectors)
         else:
-            # Get history for specific accounts - need to aggregate
-            all_data = []
-            for account_name in filter_request.account_names:
+            # Get history for specific accounts - each fetch hits an
+            # independent query path, so run them concurrently instead of
+            # paying one round-trip per account. The connector filter is
+            # applied inside each fetch so the rows arrive already trimmed.
+            async def fetch_account_history(account_name: str):
                 acc_data, _, _ = await accounts_service.get_account_state_history(
                     account_name=account_name,
                     limit=filter_request.limit,
@@ -93,30 +136,43 @@ async def get_portfolio_history(
                     start_time=start_time_dt,
                     end_time=end_time_dt
                 )
-                all_data.extend(acc_data)
-            
-            # Sort by timestamp and apply pagination
-            all_data.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-            
-            # Apply limit
-            data = all_data[:filter_request.limit]
-            has_more = len(all_data) > filter_request.limit
+                if wanted_connectors is not None:
+                    _filter_history_connectors(acc_data, wanted_connectors)
+                return acc_data
+
+            results = await asyncio.gather(
+                *(fetch_account_history(account_name) for account_name in filter_request.account_names),
+                return_exceptions=True,
+            )
+
+            account_histories = []
+            for account_name, result in zip(filter_request.account_names, results):
+                if isinstance(result, Exception):
+                    # Log error but continue with other accounts
+                    logger.warning(f"Failed to get state history for {account_name}: {result}")
+                    continue
+                account_histories.append(result)
+
+            # Each per-account history is already sorted newest-first, so a
+            # streaming k-way merge gets the first page without sorting the
+            # full concatenation; one extra item tells us if more pages exist
+            merged = merge(
+                *account_histories,
+                key=lambda x: x.get("timestamp", ""),
+                reverse=True,
+            )
+            data = list(islice(merged, filter_request.limit + 1))
+            has_more = len(data) > filter_request.limit
+            if has_more:
+                data = data[:filter_request.limit]
             next_cursor = data[-1]["timestamp"] if data and has_more else None
-        
-        # Apply connector filter to the data if specified
-        if filter_request.connector_names:
-            for item in data:
-                for account_name, account_data in item.items():
-                    if isinstance(account_data, dict) and "connectors" in account_data:
-                        filtered_connectors = {}
-                        for connector_name in filter_request.connector_names:
-                            if connector_name in account_data["connectors"]:
-                                filtered_connectors[connector_name] = account_data["connectors"][connector_name]
-                        account_data["connectors"] = filtered_connectors
-        
-        return PaginatedResponse(
-            data=data,
-            pagination={
+
+        # Serialize the page directly; the PaginatedResponse schema stays in
+        # the OpenAPI docs via the responses declaration above without
+        # FastAPI re-validating every history row on the way out
+        return ORJSONResponse({
+            "data": data,
+            "pagination": {
                 "limit": filter_request.limit,
                 "has_more": has_more,
                 "next_cursor": next_cursor,
@@ -128,7 +184,7 @@ async def get_portfolio_history(
                     "end_time": filter_request.end_time
                 }
             }
-        )
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -136,14 +192,17 @@ async def get_portfolio_history(
 @router.post("/distribution")
 async def get_portfolio_distribution(
     filter_request: PortfolioDistributionFilterRequest,
-    accounts_service: AccountsService = Depends(get_accounts_service)
+    accounts_service: AccountsService = Depends(get_accounts_service),
+    stream: bool = Query(default=False, description="Stream large distributions as NDJSON instead of one JSON document")
 ):
     """
     Get portfolio distribution by tokens with percentages across all or filtered accounts.
-    
+
     Args:
         filter_request: JSON payload with filtering criteria
-        
+        stream: If true and the distribution is large, emit one NDJSON row per
+            token after a metadata header line
+
     Returns:
         Dictionary with token distribution including percentages, values, and breakdown by accounts/connectors
     """
@@ -188,11 +247,18 @@ async def get_portfolio_distribution(
             aggregated_distribution["total_value"] += account_dist.get("total_value", 0)
             aggregated_distribution["accounts"][account_name] = account_dist.get("accounts", {}).get(account_name, {})
         
-        # Recalculate percentages
+        # Recalculate percentages; one vectorized divide over all token
+        # values instead of a Python float op per token
         total_value = aggregated_distribution["total_value"]
         if total_value > 0:
-            for token_data in aggregated_distribution["tokens"].values():
-                token_data["percentage"] = (token_data["value"] / total_value) * 100
+            tokens = aggregated_distribution["tokens"].values()
+            percentages = np.fromiter(
+                (token_data["value"] for token_data in tokens),
+                dtype=np.float64,
+                count=len(tokens),
+            ) * (100 / total_value)
+            for token_data, percentage in zip(tokens, percentages):
+                token_data["percentage"] = percentage
         
         aggregated_distribution["token_count"] = len(aggregated_distribution["tokens"])
         
@@ -202,54 +268,70 @@ async def get_portfolio_distribution(
     if filter_request.connector_names:
         filtered_distribution = []
         filtered_total_value = 0
-        
+        wanted_connectors = frozenset(filter_request.connector_names)
+
         for token_data in distribution.get("distribution", []):
-            filtered_token = {
-                "token": token_data["token"],
-                "total_value": 0,
-                "total_units": 0,
-                "percentage": 0,
-                "accounts": {}
-            }
-            
-            # Filter each account's connectors
+            filtered_accounts = {}
+            token_value = 0
+            token_units = 0
+
+            # Filter each account's connectors; intersect the key views up
+            # front and keep the running sums in locals so the inner loop
+            # does no dict writes
             for account_name, account_data in token_data.get("accounts", {}).items():
-                if "connectors" in account_data:
-                    filtered_connectors = {}
-                    account_value = 0
-                    account_units = 0
-                    
-                    # Only include specified connectors
-                    for connector_name in filter_request.connector_names:
-                        if connector_name in account_data["connectors"]:
-                            filtered_connectors[connector_name] = account_data["connectors"][connector_name]
-                            account_value += account_data["connectors"][connector_name].get("value", 0)
-                            account_units += account_data["connectors"][connector_name].get("units", 0)
-                    
-                    # Only include account if it has matching connectors
-                    if filtered_connectors:
-                        filtered_token["accounts"][account_name] = {
-                            "value": round(account_value, 6),
-                            "units": account_units,
-                            "percentage": 0,  # Will be recalculated later
-                            "connectors": filtered_connectors
-                        }
-                        
-                        filtered_token["total_value"] += account_value
-                        filtered_token["total_units"] += account_units
-            
+                account_connectors = account_data.get("connectors")
+                if not account_connectors:
+                    continue
+                matching = wanted_connectors & account_connectors.keys()
+                if not matching:
+                    continue
+
+                filtered_connectors = {}
+                account_value = 0
+                account_units = 0
+                for connector_name in matching:
+                    conn_data = account_connectors[connector_name]
+                    filtered_connectors[connector_name] = conn_data
+                    account_value += conn_data.get("value", 0)
+                    account_units += conn_data.get("units", 0)
+
+                filtered_accounts[account_name] = {
+                    "value": round(account_value, 6),
+                    "units": account_units,
+                    "percentage": 0,  # Will be recalculated later
+                    "connectors": filtered_connectors
+                }
+                token_value += account_value
+                token_units += account_units
+
             # Only include token if it has values after filtering
-            if filtered_token["total_value"] > 0:
-                filtered_distribution.append(filtered_token)
-                filtered_total_value += filtered_token["total_value"]
+            if token_value > 0:
+                filtered_distribution.append({
+                    "token": token_data["token"],
+                    "total_value": token_value,
+                    "total_units": token_units,
+                    "percentage": 0,
+                    "accounts": filtered_accounts
+                })
+                filtered_total_value += token_value
         
-        # Recalculate percentages after filtering
+        # Recalculate percentages after filtering: one vectorized pass for
+        # the token level, and a hoisted scale factor (multiply instead of
+        # divide) for the nested account entries
         if filtered_total_value > 0:
-            for token_data in filtered_distribution:
-                token_data["percentage"] = round((token_data["total_value"] / filtered_total_value) * 100, 4)
-                # Update account percentages
+            scale = 100 / filtered_total_value
+            token_percentages = np.round(
+                np.fromiter(
+                    (token_data["total_value"] for token_data in filtered_distribution),
+                    dtype=np.float64,
+                    count=len(filtered_distribution),
+                ) * scale,
+                4,
+            )
+            for token_data, percentage in zip(filtered_distribution, token_percentages):
+                token_data["percentage"] = percentage
                 for account_data in token_data["accounts"].values():
-                    account_data["percentage"] = round((account_data["value"] / filtered_total_value) * 100, 4)
+                    account_data["percentage"] = round(account_data["value"] * scale, 4)
         
         # Sort by value (descending)
         filtered_distribution.sort(key=lambda x: x["total_value"], reverse=True)
@@ -261,8 +343,21 @@ async def get_portfolio_distribution(
             "distribution": filtered_distribution,
             "account_filter": distribution.get("account_filter", "filtered")
         }
-    
-    return distribution
+
+    token_rows = distribution.get("distribution")
+    if stream and token_rows and len(token_rows) >= _STREAM_DISTRIBUTION_MIN_TOKENS:
+        # Large payload: emit the metadata as a header line and then one row
+        # per token so the response never materializes as a single document
+        meta = {key: value for key, value in distribution.items() if key != "distribution"}
+
+        async def iter_distribution():
+            yield orjson.dumps(meta, option=orjson.OPT_SERIALIZE_NUMPY, default=str) + b"\n"
+            for token_data in token_rows:
+                yield orjson.dumps(token_data, option=orjson.OPT_SERIALIZE_NUMPY, default=str) + b"\n"
+
+        return StreamingResponse(iter_distribution(), media_type="application/x-ndjson")
+
+    return ORJSONResponse(distribution)
 
 
 @router.post("/accounts-distribution")
@@ -283,7 +378,7 @@ async def get_accounts_distribution(
     
     # If no filter, return all accounts
     if not filter_request.account_names:
-        return all_distribution
+        return ORJSONResponse(all_distribution)
     
     # Filter the distribution by requested accounts
     filtered_distribution = {
@@ -292,33 +387,45 @@ async def get_accounts_distribution(
         "account_count": 0
     }
     
-    for account_name in filter_request.account_names:
-        if account_name in all_distribution.get("accounts", {}):
-            filtered_distribution["accounts"][account_name] = all_distribution["accounts"][account_name]
-            filtered_distribution["total_value"] += all_distribution["accounts"][account_name].get("total_value", 0)
-    
-    # Apply connector filter if specified
+    # Intersect the requested names with what actually exists, then pull all
+    # matching entries in one itemgetter call instead of a .get per name
+    all_accounts = all_distribution.get("accounts", {})
+    matching_names = list(all_accounts.keys() & frozenset(filter_request.account_names))
+    if matching_names:
+        matching_data = itemgetter(*matching_names)(all_accounts)
+        if len(matching_names) == 1:
+            matching_data = (matching_data,)
+        total_value = 0
+        for account_name, account_data in zip(matching_names, matching_data):
+            filtered_distribution["accounts"][account_name] = account_data
+            total_value += account_data.get("total_value", 0)
+        filtered_distribution["total_value"] = total_value
+
+    # Apply connector filter if specified; accumulate the grand total while
+    # recomputing each account's total so the accounts dict is only walked once
     if filter_request.connector_names:
+        wanted_connectors = frozenset(filter_request.connector_names)
+        grand_total = 0
         for account_name, account_data in filtered_distribution["accounts"].items():
-            if "connectors" in account_data:
-                filtered_connectors = {}
-                for connector_name in filter_request.connector_names:
-                    if connector_name in account_data["connectors"]:
-                        filtered_connectors[connector_name] = account_data["connectors"][connector_name]
+            account_connectors = account_data.get("connectors")
+            if account_connectors is not None:
+                filtered_connectors = {
+                    connector_name: account_connectors[connector_name]
+                    for connector_name in account_connectors.keys() & wanted_connectors
+                }
                 account_data["connectors"] = filtered_connectors
-                
+
                 # Recalculate account total after connector filtering
                 new_total = sum(
-                    conn_data.get("total_balance_in_usd", 0) 
+                    conn_data.get("total_balance_in_usd", 0)
                     for conn_data in filtered_connectors.values()
                 )
                 account_data["total_value"] = new_total
-        
-        # Recalculate total_value after connector filtering
-        filtered_distribution["total_value"] = sum(
-            acc_data.get("total_value", 0) 
-            for acc_data in filtered_distribution["accounts"].values()
-        )
+                grand_total += new_total
+            else:
+                grand_total += account_data.get("total_value", 0)
+
+        filtered_distribution["total_value"] = grand_total
 
     # Recalculate percentages
     total_value = filtered_distribution["total_value"]
@@ -327,5 +434,5 @@ async def get_accounts_distribution(
             account_data["percentage"] = (account_data.get("total_value", 0) / total_value) * 100
     
     filtered_distribution["account_count"] = len(filtered_distribution["accounts"])
-    
-    return filtered_distribution
\ No newline at end of file
+
+    return ORJSONResponse(filtered_distribution)
\ No newline at end of file
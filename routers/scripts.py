@@ -1,7 +1,8 @@
-import json
-import yaml
 from typing import Dict, List
 
+import orjson
+import yaml
+
 from fastapi import APIRouter, HTTPException
 from starlette import status
 
@@ -211,4 +212,6 @@ async def get_script_config_template(script_name: str):
 
     # Extract fields and default values
     config_fields = {name: field.default for name, field in config_class.model_fields.items()}
-    return json.loads(json.dumps(config_fields, default=str))
\ No newline at end of file
+    # Round-trip through orjson to stringify non-JSON-native defaults
+    # (Decimal, enums, ...) in one Rust-backed pass instead of stdlib json
+    return orjson.loads(orjson.dumps(config_fields, default=str))
\ No newline at end of file
@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import math
 
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -8,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException
 # Create module-specific logger
 logger = logging.getLogger(__name__)
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
+from hummingbot.core.data_type.in_flight_order import OrderState
 from pydantic import BaseModel
 from starlette import status
 
@@ -24,9 +27,40 @@ from models import (
 )
 from models.accounts import LeverageRequest, PositionModeRequest
 from services.accounts_service import AccountsService
+from utils.responses import ORJSONResponse
 
 router = APIRouter(tags=["Trading"], prefix="/trading")
 
+# Cap on concurrent connector round-trips when a batch endpoint fans out
+_MAX_CONCURRENT_CONNECTOR_FETCHES = 8
+
+
+async def _gather_bounded(coros):
+    """Run connector fetches concurrently under a shared concurrency cap, collecting exceptions."""
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_CONNECTOR_FETCHES)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
+
+
+# Map OrderState to status strings; built once instead of per order
+_ORDER_STATE_STATUS = {
+    OrderState.PENDING_CREATE: "SUBMITTED",
+    OrderState.OPEN: "OPEN",
+    OrderState.PENDING_CANCEL: "OPEN",  # Still open until cancelled
+    OrderState.CANCELED: "CANCELLED",
+    OrderState.PARTIALLY_FILLED: "PARTIALLY_FILLED",
+    OrderState.FILLED: "FILLED",
+    OrderState.FAILED: "FAILED",
+    OrderState.PENDING_APPROVAL: "SUBMITTED",
+    OrderState.APPROVED: "SUBMITTED",
+    OrderState.CREATED: "SUBMITTED",
+    OrderState.COMPLETED: "FILLED",
+}
+
 
 # Trade Execution
 @router.post("/orders", response_model=TradeResponse, status_code=status.HTTP_201_CREATED)
@@ -67,7 +101,7 @@ async def place_trade(
             market_data_manager=market_data_manager,
         )
 
-        return TradeResponse(
+        return TradeResponse.model_construct(
             order_id=order_id,
             account_name=trade_request.account_name,
             connector_name=trade_request.connector_name,
@@ -142,6 +176,9 @@ async def get_positions(filter_request: PositionFilterRequest, accounts_service:
         # Filter accounts
         accounts_to_check = filter_request.account_names if filter_request.account_names else list(all_connectors.keys())
 
+        # Collect the (account, connector) pairs to query, then fetch their
+        # positions concurrently instead of one connector round-trip at a time
+        pairs = []
         for account_name in accounts_to_check:
             if account_name in all_connectors:
                 # Filter connectors
@@ -154,17 +191,21 @@ async def get_positions(filter_request: PositionFilterRequest, accounts_service:
                 for connector_name in connectors_to_check:
                     # Only fetch positions from perpetual connectors
                     if connector_name in all_connectors[account_name] and "_perpetual" in connector_name:
-                        try:
-                            positions = await accounts_service.get_account_positions(account_name, connector_name)
-                            # Add cursor-friendly identifier to each position
-                            for position in positions:
-                                position["_cursor_id"] = f"{account_name}:{connector_name}:{position.get('trading_pair', '')}"
-                            all_positions.extend(positions)
-                        except Exception as e:
-                            # Log error but continue with other connectors
-                            import logging
+                        pairs.append((account_name, connector_name))
+
+        results = await _gather_bounded(
+            accounts_service.get_account_positions(account_name, connector_name) for account_name, connector_name in pairs
+        )
 
-                            logger.warning(f"Failed to get positions for {account_name}/{connector_name}: {e}")
+        for (account_name, connector_name), positions in zip(pairs, results):
+            if isinstance(positions, Exception):
+                # Log error but continue with other connectors
+                logger.warning(f"Failed to get positions for {account_name}/{connector_name}: {positions}")
+                continue
+            # Add cursor-friendly identifier to each position
+            for position in positions:
+                position["_cursor_id"] = f"{account_name}:{connector_name}:{position.get('trading_pair', '')}"
+            all_positions.extend(positions)
 
         # Sort by cursor_id for consistent pagination
         all_positions.sort(key=lambda x: x.get("_cursor_id", ""))
@@ -190,15 +231,17 @@ async def get_positions(filter_request: PositionFilterRequest, accounts_service:
         for position in page_positions:
             position.pop("_cursor_id", None)
 
-        return PaginatedResponse(
-            data=page_positions,
-            pagination={
+        # Position rows are Decimal-heavy dicts straight from the connectors;
+        # return the response directly so FastAPI skips the jsonable_encoder walk
+        return ORJSONResponse({
+            "data": page_positions,
+            "pagination": {
                 "limit": filter_request.limit,
                 "has_more": has_more,
                 "next_cursor": next_cursor,
                 "total_count": len(all_positions),
             },
-        )
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching positions: {str(e)}")
@@ -287,7 +330,7 @@ async def get_active_orders(
         for order in page_orders:
             order.pop("_cursor_id", None)
 
-        return PaginatedResponse(
+        return PaginatedResponse.model_construct(
             data=page_orders,
             pagination={
                 "limit": filter_request.limit,
@@ -385,7 +428,7 @@ async def get_orders(filter_request: OrderFilterRequest, accounts_service: Accou
         for order in page_orders:
             order.pop("_cursor_id", None)
 
-        return PaginatedResponse(
+        return PaginatedResponse.model_construct(
             data=page_orders,
             pagination={
                 "limit": filter_request.limit,
@@ -488,7 +531,7 @@ async def get_trades(filter_request: TradeFilterRequest, accounts_service: Accou
         for trade in page_trades:
             trade.pop("_cursor_id", None)
 
-        return PaginatedResponse(
+        return PaginatedResponse.model_construct(
             data=page_trades,
             pagination={
                 "limit": filter_request.limit,
@@ -622,6 +665,9 @@ async def get_funding_payments(
         # Filter accounts
         accounts_to_check = filter_request.account_names if filter_request.account_names else list(all_connectors.keys())
 
+        # Collect the (account, connector) pairs to query, then fetch their
+        # funding payments concurrently instead of serially per connector
+        pairs = []
         for account_name in accounts_to_check:
             if account_name in all_connectors:
                 # Filter connectors
@@ -634,24 +680,29 @@ async def get_funding_payments(
                 for connector_name in connectors_to_check:
                     # Only fetch funding payments from perpetual connectors
                     if connector_name in all_connectors[account_name] and "_perpetual" in connector_name:
-                        try:
-                            payments = await accounts_service.get_funding_payments(
-                                account_name=account_name,
-                                connector_name=connector_name,
-                                trading_pair=filter_request.trading_pair,
-                                limit=filter_request.limit * 2,  # Get more for pagination
-                            )
-                            # Add cursor-friendly identifier to each payment
-                            for payment in payments:
-                                payment["_cursor_id"] = (
-                                    f"{account_name}:{connector_name}:{payment.get('timestamp', '')}:{payment.get('trading_pair', '')}"
-                                )
-                            all_funding_payments.extend(payments)
-                        except Exception as e:
-                            # Log error but continue with other connectors
-                            import logging
+                        pairs.append((account_name, connector_name))
+
+        results = await _gather_bounded(
+            accounts_service.get_funding_payments(
+                account_name=account_name,
+                connector_name=connector_name,
+                trading_pair=filter_request.trading_pair,
+                limit=filter_request.limit * 2,  # Get more for pagination
+            )
+            for account_name, connector_name in pairs
+        )
 
-                            logger.warning(f"Failed to get funding payments for {account_name}/{connector_name}: {e}")
+        for (account_name, connector_name), payments in zip(pairs, results):
+            if isinstance(payments, Exception):
+                # Log error but continue with other connectors
+                logger.warning(f"Failed to get funding payments for {account_name}/{connector_name}: {payments}")
+                continue
+            # Add cursor-friendly identifier to each payment
+            for payment in payments:
+                payment["_cursor_id"] = (
+                    f"{account_name}:{connector_name}:{payment.get('timestamp', '')}:{payment.get('trading_pair', '')}"
+                )
+            all_funding_payments.extend(payments)
 
         # Sort by timestamp (most recent first) and then by cursor_id for consistency
         all_funding_payments.sort(key=lambda x: (x.get("timestamp", ""), x.get("_cursor_id", "")), reverse=True)
@@ -677,7 +728,7 @@ async def get_funding_payments(
         for payment in page_payments:
             payment.pop("_cursor_id", None)
 
-        return PaginatedResponse(
+        return PaginatedResponse.model_construct(
             data=page_payments,
             pagination={
                 "limit": filter_request.limit,
@@ -691,6 +742,14 @@ async def get_funding_payments(
         raise HTTPException(status_code=500, detail=f"Error fetching funding payments: {str(e)}")
 
 
+def _safe_float(value, default=None):
+    """Convert a Decimal amount to float once, mapping falsy or NaN values to the default."""
+    if not value:
+        return default
+    result = float(value)
+    return default if math.isnan(result) else result
+
+
 def _standardize_in_flight_order_response(order, account_name: str, connector_name: str) -> dict:
     """
     Convert a Hummingbot InFlightOrder to standardized format matching the orders search response.
@@ -703,29 +762,10 @@ def _standardize_in_flight_order_response(order, account_name: str, connector_na
     Returns:
         Dictionary with standardized order format
     """
-    # Map OrderState to status strings
-    from hummingbot.core.data_type.in_flight_order import OrderState
-
-    status_mapping = {
-        OrderState.PENDING_CREATE: "SUBMITTED",
-        OrderState.OPEN: "OPEN",
-        OrderState.PENDING_CANCEL: "OPEN",  # Still open until cancelled
-        OrderState.CANCELED: "CANCELLED",
-        OrderState.PARTIALLY_FILLED: "PARTIALLY_FILLED",
-        OrderState.FILLED: "FILLED",
-        OrderState.FAILED: "FAILED",
-        OrderState.PENDING_APPROVAL: "SUBMITTED",
-        OrderState.APPROVED: "SUBMITTED",
-        OrderState.CREATED: "SUBMITTED",
-        OrderState.COMPLETED: "FILLED",
-    }
-
     # Get status string
-    status = status_mapping.get(order.current_state, "SUBMITTED")
+    status = _ORDER_STATE_STATUS.get(order.current_state, "SUBMITTED")
 
     # Convert timestamps to ISO format
-    from datetime import datetime, timezone
-
     created_at = datetime.fromtimestamp(order.creation_timestamp, tz=timezone.utc).isoformat()
     updated_at = datetime.fromtimestamp(
         getattr(order, "last_update_timestamp", order.creation_timestamp), tz=timezone.utc
@@ -738,12 +778,12 @@ def _standardize_in_flight_order_response(order, account_name: str, connector_na
         "trading_pair": order.trading_pair,
         "trade_type": order.trade_type.name,
         "order_type": order.order_type.name,
-        "amount": float(order.amount) if order.amount and not math.isnan(float(order.amount)) else 0,
-        "price": float(order.price) if order.price and not math.isnan(float(order.price)) else None,
+        "amount": _safe_float(order.amount, 0),
+        "price": _safe_float(order.price),
         "status": status,
-        "filled_amount": float(getattr(order, "executed_amount_base", 0) or 0) if not math.isnan(float(getattr(order, "executed_amount_base", 0) or 0)) else 0,
-        "average_fill_price": float(getattr(order, "last_executed_price", 0)) if getattr(order, "last_executed_price", None) and not math.isnan(float(getattr(order, "last_executed_price", 0))) else None,
-        "fee_paid": float(getattr(order, "cumulative_fee_paid_quote", 0)) if getattr(order, "cumulative_fee_paid_quote", None) and not math.isnan(float(getattr(order, "cumulative_fee_paid_quote", 0))) else None,
+        "filled_amount": _safe_float(getattr(order, "executed_amount_base", None), 0),
+        "average_fill_price": _safe_float(getattr(order, "last_executed_price", None)),
+        "fee_paid": _safe_float(getattr(order, "cumulative_fee_paid_quote", None)),
         "fee_currency": None,  # InFlightOrder doesn't store fee currency directly
         "created_at": created_at,
         "updated_at": updated_at,
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import logging
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -18,6 +19,11 @@ from utils.file_system import fs_util
 # Create module-specific logger
 logger = logging.getLogger(__name__)
 
+# Shared Decimal singletons: balance/price loops compare against these on every
+# token of every connector refresh, so build them once instead of per call.
+_DECIMAL_ZERO = Decimal("0")
+_DECIMAL_ONE = Decimal("1")
+
 
 class AccountsService:
     """
@@ -36,6 +42,9 @@ class AccountsService:
     _last_known_prices = {}
     _price_update_interval = 60  # Update prices every 60 seconds
 
+    # Cap on concurrent connector refreshes during a state update
+    MAX_CONCURRENT_CONNECTOR_UPDATES = 8
+
     def __init__(self,
                  account_update_interval: int = 5,
                  default_quote: str = "USDT",
@@ -54,6 +63,7 @@ class AccountsService:
         self.default_quote = default_quote
         self.market_data_feed_manager = market_data_feed_manager
         self._update_account_state_task: Optional[asyncio.Task] = None
+        self._state_refresh_task: Optional[asyncio.Task] = None
         
         # Database setup for account states and orders
         self.db_manager = AsyncDatabaseManager(settings.database.url)
@@ -71,7 +81,11 @@ class AccountsService:
     def get_accounts_state(self):
         return self.accounts_state
 
+    @functools.lru_cache(maxsize=2048)
     def get_default_market(self, token: str, connector_name: str) -> str:
+        # Pure string munging over a small token/connector vocabulary, called
+        # for every balance row on every refresh — memoize so repeats are a
+        # dict lookup.
         if token.startswith("LD") and token != "LDO":
             # These tokens are staked in binance earn
             token = token[2:]
@@ -137,12 +151,9 @@ class AccountsService:
             
             async with self.db_manager.get_session_context() as session:
                 repository = AccountRepository(session)
-                
-                # Save each account-connector combination with the same timestamp
-                for account_name, connectors in self.accounts_state.items():
-                    for connector_name, tokens_info in connectors.items():
-                        if tokens_info:  # Only save if there's token data
-                            await repository.save_account_state(account_name, connector_name, tokens_info, snapshot_timestamp)
+
+                # Save the whole snapshot in one batched transaction
+                await repository.save_account_states_batch(self.accounts_state, snapshot_timestamp)
                             
         except Exception as e:
             logger.error(f"Error saving account state to database: {e}")
@@ -229,7 +240,7 @@ class AccountsService:
             # Get current balances to determine which tokens need price tracking
             balances = connector.get_all_balances()
             unique_tokens = [token for token, value in balances.items() if 
-                           value != Decimal("0") and token not in settings.banned_tokens and "USD" not in token]
+                           value != _DECIMAL_ZERO and token not in settings.banned_tokens and "USD" not in token]
             
             if unique_tokens:
                 # Create trading pairs for price tracking
@@ -244,24 +255,61 @@ class AccountsService:
             logger.error(f"Error initializing price tracking for {connector_name} in account {account_name}: {e}")
 
     async def update_account_state(self):
-        """Update account state for all connectors."""
+        """
+        Update account state for all connectors concurrently.
+
+        Concurrent callers are coalesced onto a single in-flight refresh: the
+        update loop and ad-hoc triggers (e.g. adding credentials) can overlap,
+        and running two full connector sweeps at once only duplicates the
+        exchange calls.
+        """
+        task = self._state_refresh_task
+        if task is not None and not task.done():
+            await asyncio.shield(task)
+            return
+
+        task = asyncio.create_task(self._update_account_state())
+        self._state_refresh_task = task
+        try:
+            await task
+        finally:
+            if self._state_refresh_task is task:
+                self._state_refresh_task = None
+
+    async def _update_account_state(self):
+        """Run one full refresh of every account's connector token info."""
         all_connectors = self.connector_manager.get_all_connectors()
-        
+
+        # Each connector refresh is an independent set of network calls, so fan
+        # them out together, but bound the concurrency so accounts with many
+        # connectors don't open every exchange session at the same instant.
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CONNECTOR_UPDATES)
+
+        async def bounded_tokens_info(connector, connector_name):
+            async with semaphore:
+                return await self._get_connector_tokens_info(connector, connector_name)
+
+        pairs = []
+        tasks = []
         for account_name, connectors in all_connectors.items():
             if account_name not in self.accounts_state:
                 self.accounts_state[account_name] = {}
             for connector_name, connector in connectors.items():
-                try:
-                    tokens_info = await self._get_connector_tokens_info(connector, connector_name)
-                    self.accounts_state[account_name][connector_name] = tokens_info
-                except Exception as e:
-                    logger.error(f"Error updating balances for connector {connector_name} in account {account_name}: {e}")
-                    self.accounts_state[account_name][connector_name] = []
+                pairs.append((account_name, connector_name))
+                tasks.append(bounded_tokens_info(connector, connector_name))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for (account_name, connector_name), result in zip(pairs, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error updating balances for connector {connector_name} in account {account_name}: {result}")
+                self.accounts_state[account_name][connector_name] = []
+            else:
+                self.accounts_state[account_name][connector_name] = result
 
     async def _get_connector_tokens_info(self, connector, connector_name: str) -> List[Dict]:
         """Get token info from a connector instance using cached prices when available."""
         balances = [{"token": key, "units": value} for key, value in connector.get_all_balances().items() if
-                    value != Decimal("0") and key not in settings.banned_tokens]
+                    value != _DECIMAL_ZERO and key not in settings.banned_tokens]
         unique_tokens = [balance["token"] for balance in balances]
         trading_pairs = [self.get_default_market(token, connector_name) for token in unique_tokens if "USD" not in token]
         
@@ -298,18 +346,21 @@ class AccountsService:
         tokens_info = []
         for balance in balances:
             token = balance["token"]
+            # The output dict is all floats, so price math stays in float
+            # instead of round-tripping through Decimal(str(...))
+            units = float(balance["units"])
             if "USD" in token:
-                price = Decimal("1")
+                price = 1.0
             else:
-                market = self.get_default_market(balance["token"], connector_name)
-                price = Decimal(str(all_prices.get(market, 0)))
-                
+                market = self.get_default_market(token, connector_name)
+                price = float(all_prices.get(market, 0))
+
             tokens_info.append({
-                "token": balance["token"],
-                "units": float(balance["units"]),
-                "price": float(price),
-                "value": float(price * balance["units"]),
-                "available_units": float(connector.get_available_balance(balance["token"]))
+                "token": token,
+                "units": units,
+                "price": price,
+                "value": price * units,
+                "available_units": float(connector.get_available_balance(token))
             })
         return tokens_info
     
@@ -339,7 +390,7 @@ class AccountsService:
                 fallback_prices[pair] = self._last_known_prices[pair]
                 logger.info(f"Using cached price {self._last_known_prices[pair]} for {pair}")
             else:
-                fallback_prices[pair] = Decimal("0")
+                fallback_prices[pair] = _DECIMAL_ZERO
                 logger.warning(f"No cached price available for {pair}, using 0")
         return fallback_prices
 
@@ -616,39 +667,47 @@ class AccountsService:
                         for token_info in connector_data:
                             token = token_info.get("token", "")
                             value = token_info.get("value", 0)
-                            
-                            if token not in token_values:
-                                token_values[token] = {
+                            units = token_info.get("units", 0)
+
+                            # Bind each aggregation level to a local once rather
+                            # than re-walking the nested subscript chain per field
+                            entry = token_values.get(token)
+                            if entry is None:
+                                entry = token_values[token] = {
                                     "token": token,
                                     "total_value": 0,
                                     "total_units": 0,
                                     "accounts": {}
                                 }
-                            
-                            token_values[token]["total_value"] += value
-                            token_values[token]["total_units"] += token_info.get("units", 0)
+
+                            entry["total_value"] += value
+                            entry["total_units"] += units
                             total_value += value
-                            
+
                             # Track by account
-                            if acc_name not in token_values[token]["accounts"]:
-                                token_values[token]["accounts"][acc_name] = {
+                            accounts = entry["accounts"]
+                            acct = accounts.get(acc_name)
+                            if acct is None:
+                                acct = accounts[acc_name] = {
                                     "value": 0,
                                     "units": 0,
                                     "connectors": {}
                                 }
-                            
-                            token_values[token]["accounts"][acc_name]["value"] += value
-                            token_values[token]["accounts"][acc_name]["units"] += token_info.get("units", 0)
-                            
+
+                            acct["value"] += value
+                            acct["units"] += units
+
                             # Track by connector within account
-                            if connector_name not in token_values[token]["accounts"][acc_name]["connectors"]:
-                                token_values[token]["accounts"][acc_name]["connectors"][connector_name] = {
+                            connectors = acct["connectors"]
+                            conn = connectors.get(connector_name)
+                            if conn is None:
+                                conn = connectors[connector_name] = {
                                     "value": 0,
                                     "units": 0
                                 }
-                            
-                            token_values[token]["accounts"][acc_name]["connectors"][connector_name]["value"] += value
-                            token_values[token]["accounts"][acc_name]["connectors"][connector_name]["units"] += token_info.get("units", 0)
+
+                            conn["value"] += value
+                            conn["units"] += units
             
             # Calculate percentages
             distribution = []
@@ -872,7 +931,7 @@ class AccountsService:
                     trading_pair=trading_pair,
                     amount=quantized_amount,
                     order_type=order_type,
-                    price=price or Decimal("1"),
+                    price=price or _DECIMAL_ONE,
                     position_action=position_action
                 )
             else:
@@ -880,7 +939,7 @@ class AccountsService:
                     trading_pair=trading_pair,
                     amount=quantized_amount,
                     order_type=order_type,
-                    price=price or Decimal("1"),
+                    price=price or _DECIMAL_ONE,
                     position_action=position_action
                 )
 
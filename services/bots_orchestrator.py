@@ -3,12 +3,15 @@ import logging
 from typing import Optional
 import re
 
-import docker
-
+from utils.docker_client import get_shared_docker_client
 from utils.mqtt_manager import MQTTManager
 
 logger = logging.getLogger(__name__)
 
+# Compiled once: the container filter runs against every container on each
+# monitoring pass, so skip the per-call re-module cache lookup.
+_HUMMINGBOT_IMAGE_RE = re.compile(r'.+/hummingbot:')
+
 
 # HummingbotPerformanceListener class is no longer needed
 # All functionality is now handled by MQTTManager
@@ -23,8 +26,8 @@ class BotsOrchestrator:
         self.broker_username = broker_username
         self.broker_password = broker_password
 
-        # Initialize Docker client
-        self.docker_client = docker.from_env()
+        # Initialize Docker client (shared process-wide connection pool)
+        self.docker_client = get_shared_docker_client()
 
         # Initialize MQTT manager
         self.mqtt_manager = MQTTManager(host=broker_host, port=broker_port, username=broker_username, password=broker_password)
@@ -44,8 +47,7 @@ class BotsOrchestrator:
         try:
             # Get the image name (first tag if available, otherwise the image ID)
             image_name = container.image.tags[0] if container.image.tags else str(container.image)
-            pattern = r'.+/hummingbot:'
-            return bool(re.match(pattern, image_name))
+            return bool(_HUMMINGBOT_IMAGE_RE.match(image_name))
         except Exception:
             return False
 
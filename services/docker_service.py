@@ -14,6 +14,7 @@ from docker.types import LogConfig
 
 from config import settings
 from models import V2ScriptDeployment
+from utils.docker_client import get_shared_docker_client
 from utils.file_system import fs_util
 
 
@@ -22,57 +23,73 @@ class DockerService:
     PULL_STATUS_MAX_AGE_SECONDS = 3600  # Keep status for 1 hour
     PULL_STATUS_MAX_ENTRIES = 100  # Maximum number of entries to keep
     CLEANUP_INTERVAL_SECONDS = 300  # Run cleanup every 5 minutes
-    
+    PING_CACHE_TTL_SECONDS = 2.0  # Reuse daemon health checks within this window
+    IMAGES_CACHE_TTL_SECONDS = 10.0  # Image list only changes on pulls, which invalidate it
+    MAX_CONCURRENT_PULLS = 3  # Reject further pulls instead of queueing unbounded threads
+    CONTAINER_STATUS_CACHE_TTL_SECONDS = 1.0  # Status pollers reuse the last inspect briefly
+
     def __init__(self):
         self.SOURCE_PATH = os.getcwd()
         self._pull_status: Dict[str, Dict] = {}
         self._cleanup_thread = None
         self._stop_cleanup = threading.Event()
+        self._ping_result = False
+        self._ping_checked_at = 0.0
+        self._images_cache = None
+        self._images_cached_at = 0.0
+        self._container_status_cache: Dict[str, tuple] = {}
         
         try:
-            self.client = docker.from_env()
+            self.client = get_shared_docker_client()
             # Start background cleanup thread
             self._start_cleanup_thread()
         except DockerException as e:
             logger.error(f"It was not possible to connect to Docker. Please make sure Docker is running. Error: {e}")
 
+    @staticmethod
+    def _containers_info(containers, name_filter: str = None):
+        """Project containers to info dicts, lowering the name filter once."""
+        needle = name_filter.lower() if name_filter else None
+        return [
+            {
+                "id": container.id,
+                "name": container.name,
+                "status": container.status,
+                "image": container.image.tags[0] if container.image.tags else container.image.id[:12]
+            }
+            for container in containers
+            if needle is None or needle in container.name.lower()
+        ]
+
     def get_active_containers(self, name_filter: str = None):
         try:
             all_containers = self.client.containers.list(filters={"status": "running"})
-            if name_filter:
-                containers_info = [
-                    {
-                        "id": container.id,
-                        "name": container.name,
-                        "status": container.status,
-                        "image": container.image.tags[0] if container.image.tags else container.image.id[:12]
-                    }
-                    for container in all_containers if name_filter.lower() in container.name.lower()
-                ]
-            else:
-                containers_info = [
-                    {
-                        "id": container.id,
-                        "name": container.name,
-                        "status": container.status,
-                        "image": container.image.tags[0] if container.image.tags else container.image.id[:12]
-                    }
-                    for container in all_containers
-                ]
-            return containers_info
+            return self._containers_info(all_containers, name_filter)
         except DockerException as e:
             return str(e)
 
     def get_available_images(self):
+        # The image list is slow-moving metadata: serve it from a short TTL
+        # cache and let pulls invalidate it so fresh images show up at once
+        now = time.time()
+        if self._images_cache is not None and now - self._images_cached_at < self.IMAGES_CACHE_TTL_SECONDS:
+            return self._images_cache
         try:
             images = self.client.images.list()
-            return {"images": images}
+            self._images_cache = {"images": images}
+            self._images_cached_at = now
+            return self._images_cache
         except DockerException as e:
             return str(e)
 
+    def _invalidate_images_cache(self):
+        self._images_cache = None
+
     def pull_image(self, image_name):
         try:
-            return self.client.images.pull(image_name)
+            result = self.client.images.pull(image_name)
+            self._invalidate_images_cache()
+            return result
         except DockerException as e:
             return str(e)
 
@@ -80,6 +97,7 @@ class DockerService:
         """Synchronous pull operation for background tasks"""
         try:
             result = self.client.images.pull(image_name)
+            self._invalidate_images_cache()
             return {"success": True, "image": image_name, "result": str(result)}
         except DockerException as e:
             return {"success": False, "error": str(e)}
@@ -87,27 +105,7 @@ class DockerService:
     def get_exited_containers(self, name_filter: str = None):
         try:
             all_containers = self.client.containers.list(filters={"status": "exited"}, all=True)
-            if name_filter:
-                containers_info = [
-                    {
-                        "id": container.id,
-                        "name": container.name,
-                        "status": container.status,
-                        "image": container.image.tags[0] if container.image.tags else container.image.id[:12]
-                    }
-                    for container in all_containers if name_filter.lower() in container.name.lower()
-                ]
-            else:
-                containers_info = [
-                    {
-                        "id": container.id,
-                        "name": container.name,
-                        "status": container.status,
-                        "image": container.image.tags[0] if container.image.tags else container.image.id[:12]
-                    }
-                    for container in all_containers
-                ]
-            return containers_info
+            return self._containers_info(all_containers, name_filter)
         except DockerException as e:
             return str(e)
 
@@ -118,16 +116,24 @@ class DockerService:
             return str(e)
 
     def is_docker_running(self):
+        # The ping is a full round-trip to the Docker daemon; cache it briefly
+        # so health checks hitting this endpoint don't stack up round-trips.
+        now = time.time()
+        if now - self._ping_checked_at < self.PING_CACHE_TTL_SECONDS:
+            return self._ping_result
         try:
             self.client.ping()
-            return True
+            self._ping_result = True
         except DockerException:
-            return False
+            self._ping_result = False
+        self._ping_checked_at = now
+        return self._ping_result
 
     def stop_container(self, container_name):
         try:
             container = self.client.containers.get(container_name)
             container.stop()
+            self._container_status_cache.pop(container_name, None)
         except DockerException as e:
             return str(e)
 
@@ -135,28 +141,45 @@ class DockerService:
         try:
             container = self.client.containers.get(container_name)
             container.start()
+            self._container_status_cache.pop(container_name, None)
         except DockerException as e:
             return str(e)
 
     def get_container_status(self, container_name):
-        """Get the status of a container"""
+        """Get the status of a container.
+
+        Status checks are polled aggressively during stop/archive flows, so
+        the last inspect is reused for a short TTL; lifecycle operations
+        invalidate the entry to keep transitions visible immediately.
+        """
+        now = time.time()
+        cached = self._container_status_cache.get(container_name)
+        if cached is not None and now - cached[0] < self.CONTAINER_STATUS_CACHE_TTL_SECONDS:
+            return cached[1]
         try:
-            container = self.client.containers.get(container_name)
-            return {
+            # One low-level inspect instead of building a Container model
+            # object; the state fields are read straight off the raw dict
+            info = self.client.api.inspect_container(container_name)
+            state = info.get("State", {})
+            status = state.get("Status")
+            result = {
                 "success": True,
                 "state": {
-                    "status": container.status,
-                    "running": container.status == "running",
-                    "exit_code": getattr(container.attrs.get("State", {}), "ExitCode", None)
+                    "status": status,
+                    "running": status == "running",
+                    "exit_code": state.get("ExitCode")
                 }
             }
         except DockerException as e:
-            return {"success": False, "message": str(e)}
+            result = {"success": False, "message": str(e)}
+        self._container_status_cache[container_name] = (now, result)
+        return result
 
     def remove_container(self, container_name, force=True):
         try:
             container = self.client.containers.get(container_name)
             container.remove(force=force)
+            self._container_status_cache.pop(container_name, None)
             return {"success": True, "message": f"Container {container_name} removed successfully."}
         except DockerException as e:
             return {"success": False, "message": str(e)}
@@ -297,6 +320,11 @@ class DockerService:
             # Wait for the next cleanup interval
             self._stop_cleanup.wait(self.CLEANUP_INTERVAL_SECONDS)
 
+    @staticmethod
+    def _pull_end_time(status_info: Dict):
+        """Return when a pull finished, whichever of completed_at/failed_at is set."""
+        return status_info.get("completed_at") or status_info.get("failed_at")
+
     def _cleanup_old_pull_status(self):
         """Remove old entries to prevent memory growth"""
         current_time = time.time()
@@ -309,7 +337,7 @@ class DockerService:
                 continue
                 
             # Check age of completed/failed operations
-            end_time = status_info.get("completed_at") or status_info.get("failed_at")
+            end_time = self._pull_end_time(status_info)
             if end_time and (current_time - end_time > self.PULL_STATUS_MAX_AGE_SECONDS):
                 to_remove.append(image_name)
         
@@ -326,7 +354,7 @@ class DockerService:
             ]
             # Sort by end time (oldest first)
             completed_entries.sort(
-                key=lambda x: x[1].get("completed_at") or x[1].get("failed_at") or 0
+                key=lambda x: self._pull_end_time(x[1]) or 0
             )
             
             # Remove oldest entries to get under limit
@@ -348,6 +376,17 @@ class DockerService:
                     "image_name": image_name
                 }
         
+        # Apply backpressure at admission: each pull holds a thread and
+        # daemon bandwidth, so fail fast when saturated instead of stacking
+        # an unbounded queue of pulls
+        active_pulls = sum(1 for info in self._pull_status.values() if info["status"] == "pulling")
+        if active_pulls >= self.MAX_CONCURRENT_PULLS:
+            return {
+                "message": f"Too many pulls in progress ({active_pulls}); retry once one finishes",
+                "status": "rejected",
+                "image_name": image_name
+            }
+
         # Start the pull in a background thread
         threading.Thread(target=self._pull_image_with_tracking, args=(image_name,), daemon=True).start()
         
@@ -402,10 +441,10 @@ class DockerService:
             if start_time:
                 if status_copy["status"] == "pulling":
                     status_copy["duration_seconds"] = round(time.time() - start_time, 2)
-                elif "completed_at" in status_copy:
-                    status_copy["duration_seconds"] = round(status_copy["completed_at"] - start_time, 2)
-                elif "failed_at" in status_copy:
-                    status_copy["duration_seconds"] = round(status_copy["failed_at"] - start_time, 2)
+                else:
+                    end_time = self._pull_end_time(status_copy)
+                    if end_time:
+                        status_copy["duration_seconds"] = round(end_time - start_time, 2)
             
             operations[image_name] = status_copy
         
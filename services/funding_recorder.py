@@ -66,9 +66,13 @@ class FundingRecorder:
                 if positions:
                     for position in positions.values():
                         if position.trading_pair == event.trading_pair:
+                            # Normalize to the bare vocabulary word: str() on an
+                            # enum yields "PositionSide.LONG", which is not a
+                            # valid PositionSide column value
+                            side = position.position_side
                             position_data = {
                                 "size": float(position.amount),
-                                "side": position.position_side.name if hasattr(position.position_side, 'name') else str(position.position_side),
+                                "side": side.name if hasattr(side, 'name') else str(side).rsplit(".", 1)[-1],
                             }
                             break
             except Exception as e:
@@ -25,7 +25,9 @@ class MarketDataFeedManager:
     is last accessed. Feeds that haven't been accessed within the specified timeout period 
     are automatically stopped and cleaned up.
     """
-    
+
+    TRADING_RULES_CACHE_TTL = 30  # seconds; rules change rarely relative to request rate
+
     def __init__(self, market_data_provider: MarketDataProvider, rate_oracle: RateOracle, cleanup_interval: int = 300, feed_timeout: int = 600):
         """
         Initialize the MarketDataFeedManager.
@@ -41,6 +43,7 @@ class MarketDataFeedManager:
         self.feed_timeout = feed_timeout
         self.last_access_times: Dict[str, float] = {}
         self.feed_configs: Dict[str, tuple] = {}  # Store feed configs for cleanup
+        self._trading_rules_cache: Dict[str, tuple] = {}  # connector_name: (fetched_at, serialized rules)
         self._cleanup_task: Optional[asyncio.Task] = None
         self._is_running = False
         self.logger = logging.getLogger(__name__)
@@ -171,70 +174,69 @@ class MarketDataFeedManager:
         self.logger.debug(f"Accessed order book snapshot: {feed_key}")
         return snapshot
     
+    @staticmethod
+    def _serialize_trading_rule(rule) -> Dict:
+        """Convert a hummingbot TradingRule into a JSON-friendly dictionary."""
+        return {
+            "min_order_size": float(rule.min_order_size),
+            "max_order_size": float(rule.max_order_size) if rule.max_order_size else None,
+            "min_price_increment": float(rule.min_price_increment),
+            "min_base_amount_increment": float(rule.min_base_amount_increment),
+            "min_quote_amount_increment": float(rule.min_quote_amount_increment),
+            "min_notional_size": float(rule.min_notional_size),
+            "min_order_value": float(rule.min_order_value),
+            "max_price_significant_digits": float(rule.max_price_significant_digits),
+            "supports_limit_orders": rule.supports_limit_orders,
+            "supports_market_orders": rule.supports_market_orders,
+            "buy_order_collateral_token": rule.buy_order_collateral_token,
+            "sell_order_collateral_token": rule.sell_order_collateral_token,
+        }
+
     async def get_trading_rules(self, connector_name: str, trading_pairs: Optional[List[str]] = None) -> Dict[str, Dict]:
         """
         Get trading rules for specified trading pairs from a connector.
-        
+
         Args:
             connector_name: Name of the connector
             trading_pairs: List of trading pairs to get rules for. If None, get all available.
-            
+
         Returns:
             Dictionary mapping trading pairs to their trading rules
         """
         try:
-            # Access connector through MarketDataProvider's _rate_sources LazyDict
-            connector = self.market_data_provider._non_trading_connectors[connector_name]
-            
-            # Check if trading rules are initialized, if not update them
-            if not connector.trading_rules or len(connector.trading_rules) == 0:
-                await connector._update_trading_rules()
-            
-            # Get trading rules
+            # Serve from the short-lived cache when possible; rules barely move
+            # intra-minute, so repeated requests skip the connector round-trip
+            # and the per-rule serialization entirely
+            cached = self._trading_rules_cache.get(connector_name)
+            if cached and time.time() - cached[0] < self.TRADING_RULES_CACHE_TTL:
+                all_rules = cached[1]
+            else:
+                # Access connector through MarketDataProvider's _rate_sources LazyDict
+                connector = self.market_data_provider._non_trading_connectors[connector_name]
+
+                # Check if trading rules are initialized, if not update them
+                if not connector.trading_rules or len(connector.trading_rules) == 0:
+                    await connector._update_trading_rules()
+
+                all_rules = {
+                    trading_pair: self._serialize_trading_rule(rule)
+                    for trading_pair, rule in connector.trading_rules.items()
+                }
+                self._trading_rules_cache[connector_name] = (time.time(), all_rules)
+
             if trading_pairs:
                 # Get rules for specific trading pairs
-                result = {}
-                for trading_pair in trading_pairs:
-                    if trading_pair in connector.trading_rules:
-                        rule = connector.trading_rules[trading_pair]
-                        result[trading_pair] = {
-                            "min_order_size": float(rule.min_order_size),
-                            "max_order_size": float(rule.max_order_size) if rule.max_order_size else None,
-                            "min_price_increment": float(rule.min_price_increment),
-                            "min_base_amount_increment": float(rule.min_base_amount_increment),
-                            "min_quote_amount_increment": float(rule.min_quote_amount_increment),
-                            "min_notional_size": float(rule.min_notional_size),
-                            "min_order_value": float(rule.min_order_value),
-                            "max_price_significant_digits": float(rule.max_price_significant_digits),
-                            "supports_limit_orders": rule.supports_limit_orders,
-                            "supports_market_orders": rule.supports_market_orders,
-                            "buy_order_collateral_token": rule.buy_order_collateral_token,
-                            "sell_order_collateral_token": rule.sell_order_collateral_token,
-                        }
-                    else:
-                        result[trading_pair] = {"error": f"Trading pair {trading_pair} not found"}
+                result = {
+                    trading_pair: all_rules.get(trading_pair, {"error": f"Trading pair {trading_pair} not found"})
+                    for trading_pair in trading_pairs
+                }
             else:
                 # Get all trading rules
-                result = {}
-                for trading_pair, rule in connector.trading_rules.items():
-                    result[trading_pair] = {
-                        "min_order_size": float(rule.min_order_size),
-                        "max_order_size": float(rule.max_order_size) if rule.max_order_size else None,
-                        "min_price_increment": float(rule.min_price_increment),
-                        "min_base_amount_increment": float(rule.min_base_amount_increment),
-                        "min_quote_amount_increment": float(rule.min_quote_amount_increment),
-                        "min_notional_size": float(rule.min_notional_size),
-                        "min_order_value": float(rule.min_order_value),
-                        "max_price_significant_digits": float(rule.max_price_significant_digits),
-                        "supports_limit_orders": rule.supports_limit_orders,
-                        "supports_market_orders": rule.supports_market_orders,
-                        "buy_order_collateral_token": rule.buy_order_collateral_token,
-                        "sell_order_collateral_token": rule.sell_order_collateral_token,
-                    }
-            
+                result = all_rules
+
             self.logger.debug(f"Retrieved trading rules for {connector_name}: {len(result)} pairs")
             return result
-            
+
         except Exception as e:
             self.logger.error(f"Error getting trading rules for {connector_name}: {e}")
             return {"error": str(e)}
@@ -199,7 +199,9 @@ class OrdersRecorder:
                 
                 if event.trade_fee:
                     try:
-                        base_asset, quote_asset = event.trading_pair.split("-")
+                        # partition returns a fixed 3-tuple (no list allocation)
+                        # and keeps the full quote side for multi-dash pairs
+                        base_asset, _, quote_asset = event.trading_pair.partition("-")
                         fee_in_quote = event.trade_fee.fee_amount_in_token(
                             trading_pair=event.trading_pair,
                             price=event.price,
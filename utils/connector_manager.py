@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import logging
 import time
 from decimal import Decimal
@@ -31,6 +32,9 @@ class ConnectorManager:
         self.secrets_manager = secrets_manager
         self.db_manager = db_manager
         self._connector_cache: Dict[str, ConnectorBase] = {}
+        # Lazily built account -> {connector_name: connector} view over the
+        # flat cache; invalidated whenever the cache is mutated
+        self._connectors_by_account: Optional[Dict[str, Dict[str, ConnectorBase]]] = None
         self._orders_recorders: Dict[str, any] = {}
         self._funding_recorders: Dict[str, any] = {}
         self._status_polling_tasks: Dict[str, asyncio.Task] = {}
@@ -101,12 +105,17 @@ class ConnectorManager:
         else:
             # Clear entire cache
             self._connector_cache.clear()
+        self._connectors_by_account = None
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_connector_config_map(connector_name: str):
         """
         Get the connector config map for the specified connector.
 
+        The field list is static per connector class, so cache it instead of
+        rebuilding a config adapter on every request.
+
         :param connector_name: The name of the connector.
         :return: The connector config map.
         """
@@ -150,7 +159,7 @@ class ConnectorManager:
         """
         connectors = []
         for cache_key in self._connector_cache.keys():
-            acc_name, conn_name = cache_key.split(":", 1)
+            acc_name, _, conn_name = cache_key.partition(":")
             if acc_name == account_name:
                 connectors.append(conn_name)
         return connectors
@@ -159,15 +168,21 @@ class ConnectorManager:
         """
         Get all connectors organized by account.
 
+        The nested view is built once and reused until the cache is mutated,
+        so hot callers (the account update loop, portfolio handlers) don't
+        re-scan every cache key per call. Callers must treat it as read-only.
+
         :return: Dictionary mapping account names to their connectors.
         """
-        result = {}
-        for cache_key, connector in self._connector_cache.items():
-            account_name, connector_name = cache_key.split(":", 1)
-            if account_name not in result:
-                result[account_name] = {}
-            result[account_name][connector_name] = connector
-        return result
+        if self._connectors_by_account is None:
+            result = {}
+            for cache_key, connector in self._connector_cache.items():
+                account_name, _, connector_name = cache_key.partition(":")
+                if account_name not in result:
+                    result[account_name] = {}
+                result[account_name][connector_name] = connector
+            self._connectors_by_account = result
+        return self._connectors_by_account
 
     def is_connector_initialized(self, account_name: str, connector_name: str) -> bool:
         """
@@ -210,6 +225,7 @@ class ConnectorManager:
             await connector._update_positions()
 
         self._connector_cache[cache_key] = connector
+        self._connectors_by_account = None
 
         # Load existing orders from database before starting network
         if self.db_manager:
@@ -347,7 +363,7 @@ class ConnectorManager:
         This can be called periodically to refresh connector data.
         """
         for cache_key, connector in self._connector_cache.items():
-            account_name, connector_name = cache_key.split(":", 1)
+            account_name, _, connector_name = cache_key.partition(":")
             try:
                 await self._update_connector_state(connector, connector_name)
             except Exception as e:
@@ -506,7 +522,7 @@ class ConnectorManager:
         Stop all connectors and their associated services.
         """
         # Get all account/connector pairs
-        pairs = [(k.split(":", 1)[0], k.split(":", 1)[1]) for k in self._connector_cache.keys()]
+        pairs = [(acc, conn) for acc, _, conn in (k.partition(":") for k in self._connector_cache.keys())]
 
         # Stop each connector
         for account_name, connector_name in pairs:
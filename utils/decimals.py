@@ -0,0 +1,18 @@
+from decimal import Decimal
+
+# Shared zero singleton; repositories accumulate against this instead of
+# constructing Decimal("0") per call
+DECIMAL_ZERO = Decimal("0")
+
+
+def to_decimal(value) -> Decimal:
+    """
+    Convert a stored float/int/str amount to Decimal through str.
+
+    Going through str avoids binary-float artifacts leaking into Decimal
+    arithmetic, and funneling every conversion through one helper keeps the
+    pattern (and its None/0 handling) consistent across the repositories.
+    """
+    if not value:
+        return DECIMAL_ZERO
+    return Decimal(str(value))
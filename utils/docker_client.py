@@ -0,0 +1,29 @@
+import functools
+
+import docker
+
+
+@functools.lru_cache(maxsize=1)
+def get_shared_docker_client() -> docker.DockerClient:
+    """
+    Return the process-wide Docker client.
+
+    docker.from_env() builds a fresh API client with its own connection pool;
+    sharing one instance lets DockerService and BotsOrchestrator reuse the same
+    keep-alive connections to the daemon instead of each paying their own
+    socket setup.
+    """
+    return docker.from_env()
+
+
+def close_shared_docker_client() -> None:
+    """
+    Close the shared Docker client's connection pool, if one was created.
+
+    Called from the application lifespan on shutdown so the keep-alive
+    sockets to the daemon are released deterministically instead of at
+    interpreter exit.
+    """
+    if get_shared_docker_client.cache_info().currsize:
+        get_shared_docker_client().close()
+        get_shared_docker_client.cache_clear()
@@ -0,0 +1,39 @@
+import functools
+
+from fastapi import HTTPException
+
+
+def api_error_boundary(func=None, *, error_prefix: str = None):
+    """
+    Map common exceptions from an async route handler to HTTP errors.
+
+    Replaces the try/except block repeated across router handlers: HTTPException
+    passes through untouched, FileNotFoundError becomes 404, FileExistsError
+    becomes 400 and anything else becomes 500, optionally prefixed with
+    ``error_prefix``. Centralizing the block keeps each handler's code object
+    small and the mapping consistent.
+
+    Usable bare (``@api_error_boundary``) or parameterized
+    (``@api_error_boundary(error_prefix="Error fetching trades")``).
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except HTTPException:
+                raise
+            except FileNotFoundError as e:
+                raise HTTPException(status_code=404, detail=_detail(e))
+            except FileExistsError as e:
+                raise HTTPException(status_code=400, detail=_detail(e))
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=_detail(e))
+        return wrapper
+
+    def _detail(exc):
+        return f"{error_prefix}: {exc}" if error_prefix else str(exc)
+
+    if func is not None:
+        return decorate(func)
+    return decorate
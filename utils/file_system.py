@@ -1,3 +1,4 @@
+import functools
 import importlib
 import inspect
 import logging
@@ -7,6 +8,7 @@ import os
 logger = logging.getLogger(__name__)
 import shutil
 import sys
+import time
 from pathlib import Path
 from typing import List, Optional, Type
 
@@ -28,6 +30,7 @@ class FileSystemUtil:
     """
     _instance = None
     base_path: str = "bots"  # Default base path
+    DATABASES_CACHE_TTL = 10.0  # seconds; archived databases only change when a bot is archived
 
     def __new__(cls, base_path: Optional[str] = None):
         if cls._instance is None:
@@ -325,9 +328,14 @@ class FileSystemUtil:
         with open(full_path, "w", encoding='utf-8') as f:
             f.write(text)
 
-    def get_connector_keys_path(self, account_name: str, connector_name: str) -> Path:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def get_connector_keys_path(account_name: str, connector_name: str) -> Path:
         """
         Get the path to connector credentials file.
+
+        Pure string-to-Path construction hit on every credentials operation,
+        so the result is memoized per account/connector pair.
         :param account_name: Name of the account.
         :param connector_name: Name of the connector.
         :return: Path to the connector credentials file.
@@ -401,9 +409,16 @@ class FileSystemUtil:
 
     def list_databases(self) -> List[str]:
         """
-        Lists all database files in archived instances
+        Lists all database files in archived instances.
+        The directory walk is cached for a short TTL since the archive only
+        changes when a bot is archived.
         :return: List of database file paths
         """
+        now = time.monotonic()
+        cached = getattr(self, "_databases_cache", None)
+        if cached is not None and now - cached[0] < self.DATABASES_CACHE_TTL:
+            return cached[1]
+
         try:
             archived_instances = self.list_folders("archived")
         except FileNotFoundError:
@@ -421,6 +436,8 @@ class FileSystemUtil:
                     ])
             except (OSError, PermissionError) as e:
                 logger.warning(f"Error accessing database path '{db_path}': {e}")
+
+        self._databases_cache = (now, archived_databases)
         return archived_databases
 
     def list_checkpoints(self, full_path: bool = False) -> List[str]:
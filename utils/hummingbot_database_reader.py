@@ -1,6 +1,6 @@
 import os
 import pandas as pd
-import json
+import orjson
 from typing import List, Dict, Any
 
 from hummingbot.core.data_type.common import TradeType
@@ -224,9 +224,11 @@ class PerformanceDataSource:
     @property
     def executors_df(self):
         executors = pd.DataFrame(self.executors_dict)
+        # orjson decodes these per-row JSON blobs several times faster than
+        # the stdlib parser
         executors["custom_info"] = executors["custom_info"].apply(
-            lambda x: json.loads(x) if isinstance(x, str) else x)
-        executors["config"] = executors["config"].apply(lambda x: json.loads(x) if isinstance(x, str) else x)
+            lambda x: orjson.loads(x) if isinstance(x, str) else x)
+        executors["config"] = executors["config"].apply(lambda x: orjson.loads(x) if isinstance(x, str) else x)
         executors["timestamp"] = executors["timestamp"].apply(lambda x: self.ensure_timestamp_in_seconds(x))
         executors["close_timestamp"] = executors["close_timestamp"].apply(
             lambda x: self.ensure_timestamp_in_seconds(x))
@@ -1,15 +1,27 @@
 import asyncio
-import json
 import logging
+import random
 import time
 from collections import defaultdict, deque
 from contextlib import asynccontextmanager
 from typing import Any, Callable, Dict, Optional, Set
 
 import aiomqtt
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Alternative key spellings used by bot log payloads, in preference order
+_LOG_LEVEL_KEYS = ("level_name", "levelname", "level")
+_LOG_MESSAGE_KEYS = ("msg", "message")
+_LOG_TIMESTAMP_KEYS = ("timestamp", "time")
+
+# Command channels whose responses arrive on response/* topics instead
+_COMMAND_CHANNELS = frozenset(["history", "start", "stop", "config", "import_strategy"])
+
+# Prebound topic template for bot command/subscription topics
+_BOT_TOPIC = "hbot/{}/{}".format
+
 
 class MQTTManager:
     """
@@ -26,6 +38,18 @@ class MQTTManager:
         # Message handlers by topic pattern
         self._handlers: Dict[str, Callable] = {}
 
+        # Exact-match channel routing table, built once so each message is a
+        # single dict lookup instead of a walk down an if/elif chain; prefix
+        # channels (response/*, external/event/*) stay as explicit checks
+        self._channel_handlers: Dict[str, Callable] = {
+            "log": self._handle_log,
+            "notify": self._handle_notify,
+            "status_updates": self._handle_status,
+            "hb": self._handle_heartbeat,
+            "events": self._handle_events,
+            "performance": self._handle_performance,
+        }
+
         # Bot data storage
         self._bot_performance: Dict[str, Dict] = defaultdict(dict)
         self._bot_logs: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
@@ -40,7 +64,8 @@ class MQTTManager:
 
         # Connection state
         self._connected = False
-        self._reconnect_interval = 5  # seconds
+        self._reconnect_interval = 5  # base seconds; doubled per failed attempt up to the max
+        self._reconnect_interval_max = 60  # seconds
         self._client: Optional[aiomqtt.Client] = None
         self._tasks: Set[asyncio.Task] = set()
 
@@ -95,19 +120,35 @@ class MQTTManager:
         self._connected = False
 
     async def _handle_messages(self):
-        """Main message handling loop with reconnection."""
+        """Main message handling loop with reconnection.
+
+        Repeated failures back off exponentially (with jitter, so several API
+        instances don't hammer a recovering broker in lockstep); a successful
+        connection resets the delay to the base interval.
+        """
+        consecutive_failures = 0
         while True:
             try:
                 async with self._get_client() as client:
                     self._client = client
+                    consecutive_failures = 0
                     async for message in client.messages:
                         await self._process_message(message)
             except aiomqtt.MqttError as error:
-                logger.error(f'MQTT disconnected during message iteration: "{error}". Reconnecting...')
-                await asyncio.sleep(self._reconnect_interval)
+                consecutive_failures += 1
+                delay = self._reconnect_delay(consecutive_failures)
+                logger.error(f'MQTT disconnected during message iteration: "{error}". Reconnecting in {delay:.1f}s...')
+                await asyncio.sleep(delay)
             except Exception as e:
-                logger.error(f"Unexpected error in message handler: {e}. Reconnecting...")
-                await asyncio.sleep(self._reconnect_interval)
+                consecutive_failures += 1
+                delay = self._reconnect_delay(consecutive_failures)
+                logger.error(f"Unexpected error in message handler: {e}. Reconnecting in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+
+    def _reconnect_delay(self, consecutive_failures: int) -> float:
+        """Jittered exponential backoff capped at the max reconnect interval."""
+        delay = min(self._reconnect_interval * (2 ** (consecutive_failures - 1)), self._reconnect_interval_max)
+        return delay * random.uniform(0.5, 1.0)
 
     async def _process_message(self, message):
         """Process incoming MQTT message."""
@@ -128,34 +169,25 @@ class MQTTManager:
                 if namespace == "hbot":
                     # Auto-discover bot
                     self._discovered_bots[bot_id] = time.time()
-                    # Parse message
+                    # Parse message (orjson takes the raw bytes, no intermediate decode)
                     try:
-                        data = json.loads(message.payload.decode("utf-8"))
-                    except json.JSONDecodeError:
+                        data = orjson.loads(message.payload)
+                    except orjson.JSONDecodeError:
                         data = message.payload.decode("utf-8")
 
                     # Route to appropriate handler based on Hummingbot's topics
-                    if channel == "log":
-                        await self._handle_log(bot_id, data)
-                    elif channel == "notify":
-                        await self._handle_notify(bot_id, data)
-                    elif channel == "status_updates":
-                        await self._handle_status(bot_id, data)
-                    elif channel == "hb":  # heartbeat
-                        await self._handle_heartbeat(bot_id, data)
-                    elif channel == "events":
-                        await self._handle_events(bot_id, data)
-                    elif channel == "performance":
-                        await self._handle_performance(bot_id, data)
+                    handler = self._channel_handlers.get(channel)
+                    if handler is not None:
+                        await handler(bot_id, data)
                     elif channel.startswith("response/"):
                         await self._handle_command_response(bot_id, channel, data)
                     elif channel.startswith("external/event/"):
                         await self._handle_external_event(bot_id, channel, data)
-                    elif channel in ["history", "start", "stop", "config", "import_strategy"]:
+                    elif channel in _COMMAND_CHANNELS:
                         # These are command channels - responses should come on response/* topics
-                        logger.debug(f"Command channel '{channel}' for bot {bot_id} - waiting for response")
+                        logger.debug("Command channel '%s' for bot %s - waiting for response", channel, bot_id)
                     else:
-                        logger.info(f"Unknown channel '{channel}' for bot {bot_id}")
+                        logger.info("Unknown channel '%s' for bot %s", channel, bot_id)
 
                     # Call custom handlers
                     for pattern, handler in self._handlers.items():
@@ -166,7 +198,7 @@ class MQTTManager:
                                 # Run sync handler in executor
                                 await asyncio.get_event_loop().run_in_executor(None, handler, bot_id, channel, data)
         except Exception as e:
-            logger.error(f"Error processing message from {message.topic}: {e}", exc_info=True)
+            logger.error("Error processing message from %s: %s", message.topic, e, exc_info=True)
 
     def _match_topic(self, pattern: str, topic: str) -> bool:
         """Check if topic matches pattern (supports + wildcard)."""
@@ -193,9 +225,11 @@ class MQTTManager:
         """Handle log messages with deduplication."""
         # Create a unique message identifier for deduplication
         if isinstance(data, dict):
-            level = data.get("level_name") or data.get("levelname") or data.get("level", "INFO")
-            message = data.get("msg") or data.get("message", "")
-            timestamp = data.get("timestamp") or data.get("time") or time.time()
+            # Bots emit log payloads under a few key spellings; probe each key
+            # tuple once instead of chaining .get() calls per alternative
+            level = next((data[k] for k in _LOG_LEVEL_KEYS if k in data), None) or "INFO"
+            message = next((data[k] for k in _LOG_MESSAGE_KEYS if k in data), None) or ""
+            timestamp = next((data[k] for k in _LOG_TIMESTAMP_KEYS if k in data), None) or time.time()
             
             # Create hash for deduplication (bot_id + message + timestamp within 1 second)
             message_hash = f"{bot_id}:{message}:{int(timestamp)}"
@@ -213,7 +247,7 @@ class MQTTManager:
         current_time = time.time()
         if message_hash in self._processed_messages:
             # Skip duplicate message
-            logger.debug(f"Skipping duplicate log message from {bot_id}: {message[:50]}...")
+            logger.debug("Skipping duplicate log message from %s: %.50s...", bot_id, message)
             return
 
         # Clean up old message hashes (older than TTL)
@@ -268,8 +302,8 @@ class MQTTManager:
         try:
             # Parse the response data
             try:
-                data = json.loads(message.payload.decode("utf-8"))
-            except json.JSONDecodeError:
+                data = orjson.loads(message.payload)
+            except orjson.JSONDecodeError:
                 data = message.payload.decode("utf-8")
 
             # Check if we have a pending response for this topic
@@ -278,10 +312,10 @@ class MQTTManager:
                 if not future.done():
                     future.set_result(data)
             else:
-                logger.warning(f"No pending RPC response found for topic: {topic}")
+                logger.warning("No pending RPC response found for topic: %s", topic)
 
         except Exception as e:
-            logger.error(f"Error handling RPC response on {topic}: {e}", exc_info=True)
+            logger.error("Error handling RPC response on %s: %s", topic, e, exc_info=True)
 
     async def _handle_command_response(self, bot_id: str, channel: str, data: Any):
         """Handle command responses (legacy - keeping for backward compatibility)."""
@@ -371,6 +405,22 @@ class MQTTManager:
             self._pending_responses.pop(reply_to_topic, None)
             return None
 
+    @staticmethod
+    def _rpc_message(reply_to: str, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the commlib RPCMessage envelope for a command publish."""
+        now_ms = int(time.time() * 1000)
+        return {
+            "header": {
+                "timestamp": now_ms,  # Milliseconds
+                "reply_to": reply_to,
+                "msg_id": now_ms,
+                "node_id": "hummingbot-api",
+                "agent": "hummingbot-api",
+                "properties": {},
+            },
+            "data": data or {},
+        }
+
     async def _publish_command_with_reply_to(
         self, bot_id: str, command: str, data: Dict[str, Any], reply_to: str, qos: int = 1
     ) -> bool:
@@ -388,27 +438,13 @@ class MQTTManager:
             logger.error("Not connected to MQTT broker")
             return False
 
-        # Convert dots to slashes for MQTT topic
-        mqtt_bot_id = bot_id.replace(".", "/")
-
-        # Use the correct topic for each command
-        topic = f"hbot/{mqtt_bot_id}/{command}"
-
-        # Create the full RPC message structure with custom reply_to
-        message = {
-            "header": {
-                "timestamp": int(time.time() * 1000),  # Milliseconds
-                "reply_to": reply_to,  # Custom reply_to topic
-                "msg_id": int(time.time() * 1000),
-                "node_id": "hummingbot-api",
-                "agent": "hummingbot-api",
-                "properties": {},
-            },
-            "data": data or {},
-        }
+        # Convert dots to slashes for MQTT topic, then fill the prebound
+        # template; the RPC envelope is built by the shared helper
+        topic = _BOT_TOPIC(bot_id.replace(".", "/"), command)
+        message = self._rpc_message(reply_to, data)
 
         try:
-            await self._client.publish(topic, payload=json.dumps(message), qos=qos)
+            await self._client.publish(topic, payload=orjson.dumps(message), qos=qos)
             return True
         except Exception as e:
             logger.error(f"Failed to publish command to {bot_id}: {e}")
@@ -428,28 +464,13 @@ class MQTTManager:
             logger.error("Not connected to MQTT broker")
             return False
 
-        # Convert dots to slashes for MQTT topic
-        mqtt_bot_id = bot_id.replace(".", "/")
-
-        # Use the correct topic for each command
-        topic = f"hbot/{mqtt_bot_id}/{command}"
-
-        # Create the full RPC message structure as expected by commlib
-        # Based on RPCClient._prepare_request method
-        message = {
-            "header": {
-                "timestamp": int(time.time() * 1000),  # Milliseconds
-                "reply_to": f"hummingbot-api-response-{int(time.time() * 1000)}",  # Unique response topic
-                "msg_id": int(time.time() * 1000),
-                "node_id": "hummingbot-api",
-                "agent": "hummingbot-api",
-                "properties": {},
-            },
-            "data": data or {},
-        }
+        # Convert dots to slashes for MQTT topic, then fill the prebound
+        # template; the envelope matches commlib's RPCClient._prepare_request
+        topic = _BOT_TOPIC(bot_id.replace(".", "/"), command)
+        message = self._rpc_message(f"hummingbot-api-response-{int(time.time() * 1000)}", data)
 
         try:
-            await self._client.publish(topic, payload=json.dumps(message), qos=qos)
+            await self._client.publish(topic, payload=orjson.dumps(message), qos=qos)
             return True
         except Exception as e:
             logger.error(f"Failed to publish command to {bot_id}: {e}")
@@ -515,7 +536,7 @@ class MQTTManager:
             mqtt_bot_id = bot_id.replace(".", "/")
 
             # Subscribe to all topics for this specific bot
-            topic = f"hbot/{mqtt_bot_id}/#"
+            topic = _BOT_TOPIC(mqtt_bot_id, "#")
             await self._client.subscribe(topic, qos=1)
         else:
             logger.warning(f"Cannot subscribe to bot {bot_id} - not connected to MQTT")
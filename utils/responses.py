@@ -0,0 +1,33 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(obj: Any):
+    """Fallback encoder for types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, set):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson-backed response class.
+
+    Serializes response payloads with orjson's C encoder instead of the
+    stdlib json used by the default JSONResponse, which is the dominant cost
+    for large list payloads. Decimals are rendered as floats to match the
+    behaviour of FastAPI's jsonable_encoder.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )